@@ -107,7 +107,7 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry.
 
     Cleans up the integration by unloading all platforms (sensor)
-    and removing the coordinator.
+    and closing the coordinator's SFPUC session.
 
     Args:
         hass: Home Assistant instance.
@@ -116,4 +116,23 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     Returns:
         True if unload was successful, False otherwise.
     """
-    return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+
+    coordinator = getattr(entry, "runtime_data", None)
+    if unload_ok and coordinator is not None:
+        await coordinator.async_close()
+
+    return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove a config entry.
+
+    Deletes the persisted fetch state so a re-added account starts with a
+    full historical fetch.
+
+    Args:
+        hass: Home Assistant instance.
+        entry: The config entry being removed.
+    """
+    await SFWaterCoordinator.async_remove_state(hass, entry.entry_id)
@@ -1,6 +1,5 @@
 """Config flow for San Francisco Water Power Sewer integration."""
 
-import asyncio
 import logging
 from typing import Any
 
@@ -52,8 +51,13 @@ class ConfigFlowHandler(ConfigFlow, domain=DOMAIN):
                     user_input[CONF_USERNAME], user_input[CONF_PASSWORD]
                 )
                 _LOGGER.debug("Created scraper instance, attempting login...")
-                loop = asyncio.get_event_loop()
-                login_success = await loop.run_in_executor(None, scraper.login)
+                try:
+                    login_success = await self.hass.async_add_executor_job(
+                        scraper.login
+                    )
+                finally:
+                    # Validation-only session; don't leave its connections open
+                    await self.hass.async_add_executor_job(scraper.close)
 
                 if login_success:
                     _LOGGER.info(
@@ -140,8 +144,13 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                     user_input[CONF_USERNAME], user_input[CONF_PASSWORD]
                 )
                 _LOGGER.debug("Created scraper instance, attempting login...")
-                loop = asyncio.get_event_loop()
-                login_success = await loop.run_in_executor(None, scraper.login)
+                try:
+                    login_success = await self.hass.async_add_executor_job(
+                        scraper.login
+                    )
+                finally:
+                    # Validation-only session; don't leave its connections open
+                    await self.hass.async_add_executor_job(scraper.close)
 
                 if login_success:
                     _LOGGER.info(
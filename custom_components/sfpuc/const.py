@@ -9,6 +9,21 @@ CONF_PASSWORD = "password"  # nosec B105
 # Default configuration values
 DEFAULT_UPDATE_INTERVAL = 720  # minutes (12 hours - fixed for daily data)
 
+# Version of the per-entry fetch state kept in .storage
+STORAGE_VERSION = 1
+
+# Minimum spacing between requests to the SFPUC portal (seconds)
+MIN_REQUEST_INTERVAL = 2.0
+
+# First-run history windows (days back from the last available day).
+# Windows are disjoint so each period is fetched and summed exactly once:
+# monthly before the daily window, daily until hourly takes over.
+HISTORY_MONTHLY_DAYS = 730  # 2 years
+HISTORY_DAILY_DAYS = 90
+
+# Days per daily-usage download; the portal caps each export at ~7-10 days
+HISTORY_DAILY_CHUNK_DAYS = 7
+
 # Sensor data keys
 KEY_DAILY_USAGE = "daily_usage"
 KEY_LAST_UPDATED = "last_updated"
@@ -3,16 +3,32 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Callable
+import contextlib
 from datetime import datetime, timedelta
 import logging
-from typing import Any
+import time
+from typing import Any, TypeVar
 
+from homeassistant.components.recorder.models import (
+    StatisticMeanType,
+    StatisticMetaData,
+)
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import UnitOfVolume
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.util import dt as dt_util
 
-from .const import CONF_PASSWORD, CONF_USERNAME, DEFAULT_UPDATE_INTERVAL, DOMAIN
+from .const import (
+    CONF_PASSWORD,
+    CONF_USERNAME,
+    DEFAULT_UPDATE_INTERVAL,
+    DOMAIN,
+    MIN_REQUEST_INTERVAL,
+    STORAGE_VERSION,
+)
 from .data_fetcher import (
     async_backfill_missing_data,
     async_background_historical_fetch,
@@ -23,6 +39,8 @@ from .utils import async_detect_billing_day, calculate_billing_period
 
 _LOGGER = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
 
 class SFWaterCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     """San Francisco Water Power Sewer data update coordinator.
@@ -51,6 +69,8 @@ class SFWaterCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             logger=_LOGGER,
             name=DOMAIN,
             update_interval=timedelta(minutes=DEFAULT_UPDATE_INTERVAL),
+            # Only notify listeners when the usage actually changed
+            always_update=False,
         )
 
         # Add dummy listener to ensure coordinator updates continue
@@ -68,10 +88,84 @@ class SFWaterCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             config_entry.data[CONF_USERNAME],
             config_entry.data[CONF_PASSWORD],
         )
-        self._last_backfill_date: datetime | None = None
+        self._set_statistic_id(config_entry.data.get(CONF_USERNAME, "unknown"))
+        # Fetch state survives restarts so history isn't downloaded again
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{config_entry.entry_id}"
+        )
+        self._last_backfill_date: datetime | None = None  # Persisted across restarts
+        self._last_backfill_monotonic: float | None = None  # Throttles within a run
         self._historical_data_fetched = False
         self._checked_for_historical_data = False
+        self._historical_fetch_task: asyncio.Task[None] | None = None
+        self._last_historical_attempt: datetime | None = None
         self._billing_day: int | None = None  # Detected billing day from monthly data
+        self.last_updated: datetime | None = None  # Time of the last successful update
+        # Portal requests share one server-side session: run them one at a
+        # time and at least MIN_REQUEST_INTERVAL apart
+        self._request_lock = asyncio.Semaphore(1)
+        self._last_request_time: float | None = None
+
+    def _set_statistic_id(self, username: str) -> None:
+        """Build the statistic ID and metadata shared by all resolutions.
+
+        Args:
+            username: SFPUC account username/account number.
+        """
+        # Sanitize account number (lowercase, replace special chars)
+        safe_account = username.lower().replace("-", "_").replace(" ", "_")
+        self.stat_id = f"{DOMAIN}:{safe_account}_water_consumption"
+        self.statistic_metadata = StatisticMetaData(
+            has_sum=True,
+            mean_type=StatisticMeanType.NONE,
+            name="San Francisco Water Power Sewer",
+            source=DOMAIN,
+            statistic_id=self.stat_id,
+            unit_class="volume",
+            unit_of_measurement=UnitOfVolume.GALLONS.value,
+        )
+
+    async def _async_setup(self) -> None:
+        """Restore persisted fetch state before the first refresh."""
+        stored = await self._store.async_load()
+        if not stored:
+            return
+
+        self._historical_data_fetched = stored.get("historical_data_fetched", False)
+        if last_backfill := stored.get("last_backfill"):
+            restored = datetime.fromisoformat(last_backfill)
+            # Compared with dt_util.now(); treat an offset-less value as local
+            if restored.tzinfo is None:
+                restored = restored.replace(tzinfo=dt_util.get_default_time_zone())
+            self._last_backfill_date = restored
+        self.logger.debug(
+            "Restored fetch state: historical_data_fetched=%s, last_backfill=%s",
+            self._historical_data_fetched,
+            self._last_backfill_date,
+        )
+
+    async def async_save_state(self) -> None:
+        """Persist the historical fetch flag and last backfill time."""
+        await self._store.async_save(
+            {
+                "historical_data_fetched": self._historical_data_fetched,
+                "last_backfill": (
+                    self._last_backfill_date.isoformat()
+                    if self._last_backfill_date
+                    else None
+                ),
+            }
+        )
+
+    @staticmethod
+    async def async_remove_state(hass: HomeAssistant, entry_id: str) -> None:
+        """Delete the persisted fetch state of a removed config entry.
+
+        Args:
+            hass: Home Assistant instance.
+            entry_id: ID of the removed config entry.
+        """
+        await Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}").async_remove()
 
     def update_credentials(self, username: str, password: str) -> None:
         """Update the scraper credentials.
@@ -83,13 +177,125 @@ class SFWaterCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         self.logger.info(
             "Updating SFPUC credentials for user: %s", username[:3] + "***"
         )
+        # Release the previous session's connections before replacing it
+        self.hass.async_add_executor_job(self.scraper.close)
         self.scraper = SFPUCScraper(username, password)
+        self._set_statistic_id(username)
+
+    async def async_close(self) -> None:
+        """Stop the historical fetch and close the scraper session.
+
+        Called when the config entry is unloaded, so a background fetch
+        doesn't keep using the closed session or write statistics for an
+        entry that is gone.
+        """
+        if self._historical_fetch_task is not None:
+            self._historical_fetch_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._historical_fetch_task
+            self._historical_fetch_task = None
+        await self.hass.async_add_executor_job(self.scraper.close)
+
+    async def _async_portal_request(self, func: Callable[..., _T], *args: Any) -> _T:
+        """Run a blocking scraper call, serialized and rate limited.
+
+        Args:
+            func: Scraper method to run in the executor.
+            *args: Positional arguments for func.
+
+        Returns:
+            The result of func.
+        """
+        async with self._request_lock:
+            if self._last_request_time is not None:
+                wait = MIN_REQUEST_INTERVAL - (
+                    time.monotonic() - self._last_request_time
+                )
+                if wait > 0:
+                    await asyncio.sleep(wait)
+            try:
+                # The lock keeps this integration to one executor thread at a
+                # time, so it never crowds other integrations off the pool
+                return await self.hass.async_add_executor_job(func, *args)
+            finally:
+                self._last_request_time = time.monotonic()
+
+    async def _async_login(self) -> bool:
+        """Log in to the SFPUC portal and track the credentials repair issue.
+
+        Creates an invalid_credentials repair issue when the login fails and
+        removes it again once a login succeeds.
+
+        Returns:
+            True if login was successful, False otherwise.
+        """
+        from homeassistant.helpers.issue_registry import (
+            IssueSeverity,
+            async_create_issue,
+            async_delete_issue,
+        )
+
+        login_success = await self._async_portal_request(self.scraper.login)
+
+        if not login_success:
+            async_create_issue(
+                self.hass,
+                DOMAIN,
+                "invalid_credentials",
+                is_fixable=True,
+                severity=IssueSeverity.ERROR,
+                translation_key="invalid_credentials",
+                translation_placeholders={
+                    "account": self.config_entry.data.get("username", "unknown"),
+                },
+                data={"entry_id": self.config_entry.entry_id},
+            )
+            return False
+
+        # Login successful - delete any existing invalid_credentials issue
+        async_delete_issue(self.hass, DOMAIN, "invalid_credentials")
+        return True
+
+    async def async_get_usage_data(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        resolution: str,
+    ) -> list[dict[str, Any]] | None:
+        """Fetch usage data from SFPUC.
+
+        If the portal reports that the session expired, logs in again and
+        retries once.
+
+        Args:
+            start_date: Start date for data retrieval.
+            end_date: End date for data retrieval.
+            resolution: Data resolution - "hourly", "daily", or "monthly".
+
+        Returns:
+            List of usage data points, or None if the portal returned no export.
+
+        Raises:
+            requests.RequestException: If the portal could not be reached.
+        """
+        usage_data = await self._async_portal_request(
+            self.scraper.get_usage_data, start_date, end_date, resolution
+        )
+
+        if usage_data is None and not self.scraper.is_authenticated:
+            # Session expired since the last refresh - log in again and retry once
+            if await self._async_login():
+                usage_data = await self._async_portal_request(
+                    self.scraper.get_usage_data, start_date, end_date, resolution
+                )
+
+        return usage_data
 
     async def _async_update_data(self) -> dict[str, Any]:
         """Fetch data from SF PUC.
 
         This method:
-        1. Authenticates with the SFPUC portal
+        1. Authenticates with the SFPUC portal (if no session is active yet)
         2. Fetches historical data on first run
         3. Performs data backfilling for the past 30 days
         4. Calculates current billing period usage (from 25th to today)
@@ -99,66 +305,70 @@ class SFWaterCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         Returns:
             Dictionary containing current usage data with keys:
             - current_bill_usage: Cumulative usage for current billing period in gallons
-            - last_updated: Timestamp of the update
+
+            The update time is kept in self.last_updated rather than in the
+            data so unchanged usage compares equal and skips listener updates.
 
         Raises:
             UpdateFailed: If authentication fails or data retrieval encounters errors.
         """
         try:
             self.logger.debug("Starting data update cycle")
-
-            # Login (run in executor since it's blocking)
-            loop = asyncio.get_event_loop()
-            self.logger.debug("Attempting SFPUC login")
-            login_success = await loop.run_in_executor(None, self.scraper.login)
-
-            if not login_success:
-                self.logger.error("Failed to login to SF PUC - aborting update")
-                # Create an issue for invalid credentials
-                from homeassistant.helpers.issue_registry import (
-                    IssueSeverity,
-                    async_create_issue,
-                )
-
-                async_create_issue(
-                    self.hass,
-                    DOMAIN,
-                    "invalid_credentials",
-                    is_fixable=True,
-                    severity=IssueSeverity.ERROR,
-                    translation_key="invalid_credentials",
-                    translation_placeholders={
-                        "account": self.config_entry.data.get("username", "unknown"),
-                    },
-                    data={"entry_id": self.config_entry.entry_id},
-                )
-                raise UpdateFailed(
-                    "Failed to login to SF PUC - credentials may be invalid"
-                )
-
-            # Login successful - delete any existing invalid_credentials issue
-            from homeassistant.helpers.issue_registry import async_delete_issue
-
-            async_delete_issue(self.hass, DOMAIN, "invalid_credentials")
-
-            self.logger.debug("Login successful, proceeding with data fetch")
+            # One timezone-aware reference time for the whole refresh
+            now = dt_util.now()
+
+            # Reuse the existing SFPUC session; only log in when we have none
+            if not self.scraper.is_authenticated:
+                self.logger.debug("Attempting SFPUC login")
+                if not await self._async_login():
+                    self.logger.error("Failed to login to SF PUC - aborting update")
+                    raise UpdateFailed(
+                        "Failed to login to SF PUC - credentials may be invalid"
+                    )
+                self.logger.debug("Login successful, proceeding with data fetch")
+            else:
+                self.logger.debug("Reusing existing SFPUC session")
 
             # Check if we need to fetch historical data
-            # Only check once per HA session to avoid repeated database queries
-            if not self._checked_for_historical_data:
+            # Only check once per HA session to avoid repeated database queries,
+            # and not at all once a fetch has been recorded in the store
+            if (
+                not self._checked_for_historical_data
+                and not self._historical_data_fetched
+            ):
                 has_historical = await async_check_has_historical_data(self)
                 self._checked_for_historical_data = True
                 if has_historical:
                     self._historical_data_fetched = True
+                    await self.async_save_state()
                     self.logger.info(
                         "Historical data already present in database - skipping fetch"
                     )
 
             # Schedule historical data fetch on first run (if not already in database)
-            # Run in background to avoid blocking startup
+            # Run in background to avoid blocking startup. A failed fetch is
+            # retried at most once per 24 hours, never while one is running.
             if not self._historical_data_fetched:
-                self.logger.info("Scheduling historical data fetch in background...")
-                asyncio.create_task(async_background_historical_fetch(self))
+                if (
+                    self._historical_fetch_task is not None
+                    and not self._historical_fetch_task.done()
+                ):
+                    self.logger.debug("Historical data fetch already in progress")
+                elif (
+                    self._last_historical_attempt is not None
+                    and now - self._last_historical_attempt < timedelta(hours=24)
+                ):
+                    self.logger.debug(
+                        "Historical data fetch attempted recently - retrying later"
+                    )
+                else:
+                    self.logger.info(
+                        "Scheduling historical data fetch in background..."
+                    )
+                    self._last_historical_attempt = now
+                    self._historical_fetch_task = asyncio.create_task(
+                        async_background_historical_fetch(self)
+                    )
 
             # Detect billing day from monthly data (if not already detected)
             if self._billing_day is None:
@@ -179,7 +389,7 @@ class SFWaterCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 )
 
             # Calculate billing period dates (SFPUC bills ~25th of each month)
-            bill_start, bill_end = calculate_billing_period(self)
+            bill_start, bill_end = calculate_billing_period(self, now)
             self.logger.debug(
                 "Current billing period: %s to %s",
                 bill_start.date(),
@@ -196,16 +406,11 @@ class SFWaterCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             self.logger.debug(
                 "Calculating current billing period usage from statistics (%s to %s)",
                 bill_start.date(),
-                datetime.now().date(),
+                now.date(),
             )
 
             # Get hourly statistics for the current billing period
-            safe_account = (
-                self.config_entry.data.get(CONF_USERNAME, "unknown")
-                .replace("-", "_")
-                .lower()
-            )
-            stat_id = f"{DOMAIN}:{safe_account}_water_consumption"
+            stat_id = self.stat_id
 
             try:
                 # Fetch hourly statistics from bill_start to now
@@ -214,7 +419,7 @@ class SFWaterCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                     statistics_during_period,
                     self.hass,
                     dt_util.as_utc(bill_start),
-                    dt_util.as_utc(datetime.now()),
+                    dt_util.as_utc(now),
                     {stat_id},
                     "hour",
                     None,
@@ -244,8 +449,8 @@ class SFWaterCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             # Return simplified data for the single sensor
             data = {
                 "current_bill_usage": current_bill_usage,
-                "last_updated": datetime.now(),
             }
+            self.last_updated = now
 
             self.logger.info(
                 "Data update completed successfully - Current billing period usage: %.2f gallons",
@@ -282,12 +487,7 @@ class SFWaterCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             )
 
             # Get our statistic ID
-            safe_account = (
-                self.config_entry.data.get(CONF_USERNAME, "unknown")
-                .replace("-", "_")
-                .lower()
-            )
-            stat_id = f"{DOMAIN}:{safe_account}_water_consumption"
+            stat_id = self.stat_id
 
             # Query for existing statistics - this registers our domain as managing
             # its own statistics, preventing the recorder from auto-creating them
@@ -2,47 +2,58 @@
 
 import asyncio
 from datetime import datetime, timedelta
+import random
+import time
+from typing import Any
+import zoneinfo
 
 from homeassistant.components.recorder import get_instance
 from homeassistant.components.recorder.statistics import statistics_during_period
 from homeassistant.util import dt as dt_util
 
-from .const import CONF_USERNAME, DOMAIN
+from .const import HISTORY_DAILY_CHUNK_DAYS, HISTORY_DAILY_DAYS, HISTORY_MONTHLY_DAYS
 from .statistics_handler import async_insert_statistics
 
+# Minimum time between incremental backfills
+_BACKFILL_INTERVAL = timedelta(hours=12)
+
+# The portal takes and reports dates in San Francisco time, without an offset
+_PORTAL_TIMEZONE = zoneinfo.ZoneInfo("America/Los_Angeles")
+
+
+def _portal_time(moment: datetime) -> datetime:
+    """Convert an aware time to the naive San Francisco time the portal uses."""
+    return moment.astimezone(_PORTAL_TIMEZONE).replace(tzinfo=None)
+
 
 async def async_check_has_historical_data(coordinator) -> bool:
     """Check if we already have sufficient historical data in the database.
 
-    Returns True if we have daily statistics going back at least 1 year.
+    Returns True if we have statistics from about 1 year ago.
     This prevents re-fetching 2 years of data on every HA restart.
     """
     try:
-        # Check for daily statistics from 1 year ago
-        one_year_ago = datetime.now() - timedelta(days=365)
-        safe_account = (
-            coordinator.config_entry.data.get(CONF_USERNAME, "unknown")
-            .replace("-", "_")
-            .lower()
-        )
-        stat_id = f"{DOMAIN}:{safe_account}_water_consumption"
+        # Probe the month starting 1 year ago rather than reading every row
+        # since then; monthly history has a single point per billing month
+        one_year_ago = dt_util.utcnow() - timedelta(days=365)
+        stat_id = coordinator.stat_id
 
         stats = await get_instance(coordinator.hass).async_add_executor_job(
             statistics_during_period,
             coordinator.hass,
-            dt_util.as_utc(one_year_ago),
-            None,  # end_time (None = now)
+            one_year_ago,
+            one_year_ago + timedelta(days=31),
             {stat_id},
-            "hour",  # period
+            "month",  # period
             None,  # units
             {"sum"},  # types
         )
 
-        # If we have statistics going back at least 1 year, consider historical data fetched
-        if stat_id in stats and len(stats[stat_id]) > 300:  # ~300 days minimum
+        # Any statistics from a year ago means historical data was fetched
+        if stats.get(stat_id):
             coordinator.logger.info(
-                "Found %d existing daily statistics records - skipping historical data fetch",
-                len(stats[stat_id]),
+                "Found statistics from %s - skipping historical data fetch",
+                one_year_ago.date(),
             )
             return True
 
@@ -54,212 +65,338 @@ async def async_check_has_historical_data(coordinator) -> bool:
         return False
 
 
-async def async_fetch_historical_data(coordinator) -> None:
+def _chunk_schedule(
+    start_date: datetime, end_date: datetime, chunk_days: int
+) -> list[tuple[datetime, datetime]]:
+    """Split a date range into consecutive (start, end) download chunks.
+
+    Each chunk covers chunk_days calendar days, both ends included, and the
+    next one starts the day after it ends, so no day is requested twice.
+    """
+    chunks = []
+    current_start = start_date
+    while current_start < end_date:
+        chunk_end = min(current_start + timedelta(days=chunk_days - 1), end_date)
+        chunks.append((current_start, chunk_end))
+        current_start = chunk_end + timedelta(days=1)
+    return chunks
+
+
+def _day_schedule(start_date: datetime, end_date: datetime) -> list[datetime]:
+    """List one timestamp per calendar day from start_date through end_date."""
+    return [
+        start_date + timedelta(days=offset)
+        for offset in range((end_date.date() - start_date.date()).days + 1)
+    ]
+
+
+async def _async_fetch_monthly_history(
+    coordinator, start_date: datetime, end_date: datetime
+) -> list[dict[str, Any]]:
+    """Fetch monthly billed usage for the oldest part of the history.
+
+    Args:
+        start_date: First day to fetch (2 years back).
+        end_date: Start of the daily window; later months are dropped.
+
+    Returns:
+        Monthly data points, or an empty list if retrieval failed.
+    """
+    coordinator.logger.info("Fetching monthly billed usage data...")
+    try:
+        monthly_data = await coordinator.async_get_usage_data(
+            start_date,
+            end_date - timedelta(days=1),
+            "monthly",
+        )
+        # The portal reports whole months; drop any covered by daily data
+        return [point for point in monthly_data or [] if point["timestamp"] < end_date]
+    except Exception as err:
+        coordinator.logger.warning("Failed to fetch monthly billing data: %s", err)
+        return []
+
+
+async def _async_fetch_with_retry(
+    coordinator,
+    start_date: datetime,
+    end_date: datetime,
+    resolution: str,
+    max_retries: int = 3,
+) -> list[dict[str, Any]] | None:
+    """Fetch one date range, retrying network errors with exponential backoff.
+
+    The scraper raises when the portal can't be reached and returns None when
+    it answered without an export; only the former is retried, since asking
+    again for a range the portal refused gets the same answer. The backoff is
+    jittered so the many ranges queued by one fetch don't all retry in
+    lockstep after a portal outage.
+
+    Args:
+        start_date: Start date for data retrieval.
+        end_date: End date for data retrieval.
+        resolution: Data resolution - "hourly", "daily", or "monthly".
+        max_retries: Number of attempts before giving up.
+
+    Returns:
+        List of usage data points, or None if the portal returned no export.
+
+    Raises:
+        Exception: The last error if every attempt raised.
+    """
+    for attempt in range(max_retries):
+        try:
+            return await coordinator.async_get_usage_data(
+                start_date, end_date, resolution
+            )
+        except Exception as err:
+            if attempt == max_retries - 1:
+                coordinator.logger.error(
+                    "Failed to fetch %s data for %s to %s after %d attempts: %s",
+                    resolution,
+                    start_date.date(),
+                    end_date.date(),
+                    max_retries,
+                    err,
+                )
+                raise
+            coordinator.logger.warning(
+                "Failed to fetch %s data for %s to %s (attempt %d/%d): %s, retrying...",
+                resolution,
+                start_date.date(),
+                end_date.date(),
+                attempt + 1,
+                max_retries,
+                err,
+            )
+            # Exponential backoff with jitter
+            await asyncio.sleep(2**attempt * random.uniform(0.5, 1.5))  # nosec B311
+    return None
+
+
+async def _async_fetch_daily_chunk(
+    coordinator, start_date: datetime, end_date: datetime
+) -> list[dict[str, Any]] | None:
+    """Fetch one daily chunk, halving it if the portal returns no export.
+
+    The portal's per-download limit isn't documented and a range it won't
+    export comes back as a download without an export (None) rather than an
+    error, so each half is fetched on its own, down to single days. Network
+    errors are raised by the scraper instead; they are not split and
+    propagate after _async_fetch_with_retry gives up. A None that comes with
+    a lost session (the coordinator's login retry failed too) is not split
+    either, since every half would only try another login.
+
+    Returns:
+        Daily data points, leaving out single days the portal won't export,
+        or None if the session could not be restored.
+
+    Raises:
+        Exception: The last network error if every retry failed.
+    """
+    data = await _async_fetch_with_retry(coordinator, start_date, end_date, "daily")
+    if data is not None:
+        return data
+    if not coordinator.scraper.is_authenticated:
+        coordinator.logger.warning(
+            "Not logged in to SFPUC - skipping daily data for %s to %s",
+            start_date.date(),
+            end_date.date(),
+        )
+        return None
+
+    span = (end_date.date() - start_date.date()).days
+    if span == 0:
+        coordinator.logger.debug("No daily export for %s", start_date.date())
+        return []
+
+    middle = start_date + timedelta(days=span // 2)
+    coordinator.logger.debug(
+        "No daily export for %s to %s, retrying in two halves",
+        start_date.date(),
+        end_date.date(),
+    )
+    first = await _async_fetch_daily_chunk(coordinator, start_date, middle)
+    second = await _async_fetch_daily_chunk(
+        coordinator, middle + timedelta(days=1), end_date
+    )
+    if first is None or second is None:
+        return None
+    return first + second
+
+
+async def _async_fetch_daily_history(
+    coordinator, start_date: datetime, end_date: datetime
+) -> list[dict[str, Any]] | None:
+    """Fetch daily usage between the monthly and hourly windows.
+
+    SFPUC limits daily data downloads to ~7-10 days, so we fetch in chunks
+    of HISTORY_DAILY_CHUNK_DAYS, splitting any the portal refuses.
+    All chunks are queued at once; the coordinator sends them one at a time
+    with its own spacing, so no fixed delay is needed between them.
+
+    Args:
+        start_date: First day of the daily window.
+        end_date: Last day of the daily window.
+
+    Returns:
+        Daily data points, leaving out days the portal won't export even one
+        at a time, or None if the window is incomplete: a chunk still hit a
+        network error after its retries (the remaining chunks are cancelled)
+        or the session was lost.
+    """
+    coordinator.logger.info(
+        "Fetching daily data in chunks (%s to %s)...",
+        start_date.date(),
+        end_date.date(),
+    )
+    chunks = _chunk_schedule(start_date, end_date, HISTORY_DAILY_CHUNK_DAYS)
+
+    # A chunk that still fails after its retries cancels the remaining ones
+    try:
+        async with asyncio.TaskGroup() as task_group:
+            tasks = [
+                task_group.create_task(
+                    _async_fetch_daily_chunk(coordinator, chunk_start, chunk_end)
+                )
+                for chunk_start, chunk_end in chunks
+            ]
+    except ExceptionGroup as err:
+        coordinator.logger.warning("Failed to fetch daily data: %s", err.exceptions[0])
+        return None
+
+    results = [task.result() for task in tasks]
+    if any(result is None for result in results):
+        return None
+    return [point for result in results if result for point in result]
+
+
+async def _async_fetch_hourly_history(
+    coordinator, end_date: datetime
+) -> list[dict[str, Any]]:
+    """Fetch hourly usage for the past 32 days (most detailed recent data).
+
+    This fills in the gap between daily data (ends 31 days ago) and most
+    recent available. Fetches day-by-day and stops 2 days before today due
+    to SFPUC data lag. Days that fail after retries are skipped.
+
+    Args:
+        end_date: Current time; offsets are counted back from it.
+
+    Returns:
+        Hourly data points, or an empty list if retrieval failed.
+    """
+    coordinator.logger.info("Fetching hourly data for last 32 days...")
+    try:
+        # Fetch from 32 days ago to 2 days ago (respecting SFPUC data lag)
+        fetch_dates = _day_schedule(
+            end_date - timedelta(days=32), end_date - timedelta(days=2)
+        )
+        results = await asyncio.gather(
+            *(
+                _async_fetch_with_retry(coordinator, fetch_date, fetch_date, "hourly")
+                for fetch_date in fetch_dates
+            ),
+            return_exceptions=True,
+        )
+        return [
+            point
+            for hourly_chunk in results
+            if isinstance(hourly_chunk, list)
+            for point in hourly_chunk
+        ]
+    except Exception as err:
+        coordinator.logger.warning("Failed to fetch hourly data: %s", err)
+        return []
+
+
+async def async_fetch_historical_data(coordinator) -> int:
     """Fetch historical data going back months/years on first run.
 
-    Populates recorder statistics with:
-    - Monthly billed usage data for the past 2 years (billing cycle data)
-    - Daily usage data for the past 2 years (comprehensive historical data)
-    - Hourly usage data for the past 30 days (most detailed recent data)
+    Populates recorder statistics with disjoint windows, oldest first:
+    - Monthly billed usage data from 2 years ago until the daily window
+    - Daily usage data from ~90 days ago until 31 days ago
+    - Hourly usage data for the past 32 days (most detailed recent data)
 
-    Monthly data represents actual billing periods (typically 25th-25th)
-    and provides valuable year-over-year comparison data.
+    Each period is fetched at exactly one resolution, so the same usage is
+    never summed twice into the cumulative statistic. The three windows are
+    fetched concurrently (the coordinator still sends one portal request at
+    a time) and inserted in chronological order once all have finished.
 
     Logs warnings if data retrieval fails but does not raise exceptions
     to avoid blocking the initial coordinator setup.
 
     NOTE: This method is now scheduled to run in the background after
     initial setup to avoid blocking Home Assistant startup.
+
+    Returns:
+        Number of data points passed to the recorder; 0 if nothing was
+        retrieved, the daily window is incomplete or the fetch failed.
     """
     try:
         coordinator.logger.info("Background historical fetch started...")
 
-        # Fetch data strategy for first sync (oldest to newest):
-        # 1. Daily data from 2 years ago to 30 days ago (historical baseline)
-        # 2. Hourly data from 30 days ago to 2 days ago (fills gap to most recent)
-        # Regular updates will only fetch new hourly data incrementally
-        # This approach builds cumulative sum naturally in chronological order
-        end_date = datetime.now()
+        # Portal ranges and row timestamps are naive San Francisco time
+        end_date = _portal_time(dt_util.now())
         # SFPUC has ~2 day data lag - don't fetch today or yesterday
         end_date_available = end_date - timedelta(days=2)
-        loop = asyncio.get_event_loop()
 
-        # Fetch monthly billed usage data - all available history
-        coordinator.logger.info("Fetching monthly billed usage data...")
-        try:
-            # SFPUC typically has 2+ years of billing history
-            start_date = end_date - timedelta(days=730)  # 2 years back
-            monthly_data = await loop.run_in_executor(
-                None,
-                coordinator.scraper.get_usage_data,
-                start_date,
-                end_date,
-                "monthly",
-            )
-            if monthly_data:
-                await async_insert_statistics(coordinator, monthly_data)
-                coordinator.logger.info(
-                    "Fetched %d monthly billing data points", len(monthly_data)
-                )
-            else:
-                coordinator.logger.warning("No monthly billing data retrieved")
-        except Exception as err:
-            coordinator.logger.warning("Failed to fetch monthly billing data: %s", err)
-
-        # Fetch daily data for the past 2 years (comprehensive historical data)
-        # SFPUC limits daily data downloads to ~7-10 days, so we fetch in chunks
-        # Fetch from 2 years ago to 31 days ago (stops 1 day before hourly period for continuity)
-        coordinator.logger.info(
-            "Fetching daily data in chunks (2 years to 31 days ago)..."
+        # Daily window starts on a month boundary so it doesn't split a
+        # monthly data point (monthly points are keyed to the 1st)
+        start_date_daily = (
+            end_date_available - timedelta(days=HISTORY_DAILY_DAYS)
+        ).replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+        end_date_daily = end_date_available - timedelta(days=31)  # Stop 31 days ago
+
+        monthly_data, daily_data, hourly_data = await asyncio.gather(
+            _async_fetch_monthly_history(
+                coordinator,
+                end_date - timedelta(days=HISTORY_MONTHLY_DAYS),
+                start_date_daily,
+            ),
+            _async_fetch_daily_history(coordinator, start_date_daily, end_date_daily),
+            _async_fetch_hourly_history(coordinator, end_date),
         )
-        try:
-            all_daily_data = []
-            chunk_days = 3  # Fetch 3 days at a time to reduce load
-            start_date_2yr = end_date_available - timedelta(
-                days=730
-            )  # 2 years back from last available
-            end_date_daily = end_date_available - timedelta(days=31)  # Stop 31 days ago
-            current_start = start_date_2yr
-
-            while current_start < end_date_daily:
-                chunk_end = min(
-                    current_start + timedelta(days=chunk_days), end_date_daily
-                )
-                coordinator.logger.debug(
-                    "Fetching daily chunk from %s to %s",
-                    current_start.date(),
-                    chunk_end.date(),
-                )
-
-                # Retry logic for network errors
-                max_retries = 3
-                for attempt in range(max_retries):
-                    try:
-                        chunk_data = await loop.run_in_executor(
-                            None,
-                            coordinator.scraper.get_usage_data,
-                            current_start,
-                            chunk_end,
-                            "daily",
-                        )
-                        break  # Success, exit retry loop
-                    except Exception as err:
-                        if attempt < max_retries - 1:
-                            coordinator.logger.warning(
-                                "Failed to fetch daily chunk (attempt %d/%d): %s, retrying...",
-                                attempt + 1,
-                                max_retries,
-                                err,
-                            )
-                            await asyncio.sleep(2**attempt)  # Exponential backoff
-                        else:
-                            coordinator.logger.error(
-                                "Failed to fetch daily chunk after %d attempts: %s",
-                                max_retries,
-                                err,
-                            )
-                            raise  # Re-raise to stop fetching
-
-                if chunk_data:
-                    all_daily_data.extend(chunk_data)
-                    coordinator.logger.debug(
-                        "Chunk returned %d data points", len(chunk_data)
-                    )
-
-                current_start = chunk_end + timedelta(days=1)
-                # Small delay to avoid overwhelming the server
-                await asyncio.sleep(1.0)
-
-            if all_daily_data:
-                await async_insert_statistics(coordinator, all_daily_data)
-                coordinator.logger.info(
-                    "Fetched %d daily data points total", len(all_daily_data)
-                )
-            else:
-                coordinator.logger.warning("No daily data retrieved")
-        except Exception as err:
-            coordinator.logger.warning("Failed to fetch daily data: %s", err)
-
-        # Fetch hourly data for the past 32 days (most detailed recent data)
-        # This fills in the gap between daily data (ends 31 days ago) and most recent available
-        # Starts 32 days ago to create 1-day overlap with daily data for seamless continuity
-        # Fetches day-by-day to append after daily data in cumulative sum
-        # Stops 2 days before today due to SFPUC data lag
-        coordinator.logger.info("Fetching hourly data for last 32 days...")
-        try:
-            all_hourly_data = []
-            # Fetch from 32 days ago to 2 days ago (respecting SFPUC data lag)
-            # range(32, 1, -1) gives offsets 32..2, covering Oct 12 to Nov 11
-
-            for days_offset in range(
-                32,
-                1,
-                -1,  # Start from 32 days ago, stop at 2 days ago (inclusive of offset 2 = today-2)
-            ):  # Stop at 2 days ago (SFPUC data lag)
-                fetch_date = end_date - timedelta(days=days_offset)
-                coordinator.logger.debug(
-                    "Fetching hourly data for %s (offset %d days back)",
-                    fetch_date.date(),
-                    days_offset,
-                )
 
-                # Retry logic for network errors
-                max_retries = 3
-                hourly_chunk = None
-                for attempt in range(max_retries):
-                    try:
-                        # Fetch one day at a time for hourly data
-                        hourly_chunk = await loop.run_in_executor(
-                            None,
-                            coordinator.scraper.get_usage_data,
-                            fetch_date,
-                            fetch_date,  # Same day for start and end
-                            "hourly",
-                        )
-                        break  # Success
-                    except Exception as err:
-                        if attempt < max_retries - 1:
-                            coordinator.logger.warning(
-                                "Failed to fetch hourly data for %s (attempt %d/%d): %s, retrying...",
-                                fetch_date.date(),
-                                attempt + 1,
-                                max_retries,
-                                err,
-                            )
-                            await asyncio.sleep(2**attempt)  # Exponential backoff
-                        else:
-                            coordinator.logger.error(
-                                "Failed to fetch hourly data for %s after %d attempts: %s",
-                                fetch_date.date(),
-                                max_retries,
-                                err,
-                            )
-                            # Continue to next day instead of stopping
-
-                if hourly_chunk:
-                    all_hourly_data.extend(hourly_chunk)
-                    coordinator.logger.debug(
-                        "Fetched %d hourly data points for %s",
-                        len(hourly_chunk),
-                        fetch_date.date(),
-                    )
+        if monthly_data:
+            coordinator.logger.info(
+                "Fetched %d monthly billing data points", len(monthly_data)
+            )
+        else:
+            coordinator.logger.warning("No monthly billing data retrieved")
+
+        if daily_data is None:
+            # A gap can't be filled in later without rebuilding every
+            # cumulative sum after it; insert nothing so the next attempt
+            # starts from an empty statistic again
+            coordinator.logger.warning(
+                "Daily data incomplete - not inserting historical data"
+            )
+            return 0
+        if daily_data:
+            coordinator.logger.info(
+                "Fetched %d daily data points total", len(daily_data)
+            )
+        else:
+            coordinator.logger.warning("No daily data retrieved")
 
-                # Small delay to avoid overwhelming the server
-                await asyncio.sleep(0.5)
+        if hourly_data:
+            coordinator.logger.info(
+                "Fetched %d hourly data points total for past 32 days",
+                len(hourly_data),
+            )
+        else:
+            coordinator.logger.warning("No hourly data retrieved")
 
-            if all_hourly_data:
-                await async_insert_statistics(coordinator, all_hourly_data)
-                coordinator.logger.info(
-                    "Fetched %d hourly data points total for past 32 days",
-                    len(all_hourly_data),
-                )
-            else:
-                coordinator.logger.warning("No hourly data retrieved")
-        except Exception as err:
-            coordinator.logger.warning("Failed to fetch hourly data: %s", err)
+        # The windows are disjoint, so one batch sorted by start builds the
+        # cumulative sum oldest to newest in a single recorder write
+        all_data = monthly_data + daily_data + hourly_data
+        if all_data:
+            await async_insert_statistics(coordinator, all_data)
+        return len(all_data)
 
     except Exception as err:
         coordinator.logger.warning("Failed to fetch historical data: %s", err)
+        return 0
 
 
 async def async_background_historical_fetch(coordinator) -> None:
@@ -274,10 +411,17 @@ async def async_background_historical_fetch(coordinator) -> None:
         await asyncio.sleep(30)
 
         coordinator.logger.info("Starting background historical data fetch...")
-        await async_fetch_historical_data(coordinator)
+        if not await async_fetch_historical_data(coordinator):
+            # Nothing to record yet; the 24 hour gate schedules the next attempt
+            coordinator.logger.warning(
+                "Background historical data fetch retrieved no data - will retry"
+            )
+            return
         coordinator._historical_data_fetched = True
         # Set backfill date to now to avoid re-fetching the same data
-        coordinator._last_backfill_date = datetime.now()
+        coordinator._last_backfill_date = dt_util.now()
+        coordinator._last_backfill_monotonic = time.monotonic()
+        await coordinator.async_save_state()
         coordinator.logger.info(
             "Background historical data fetch completed successfully"
         )
@@ -301,14 +445,23 @@ async def async_backfill_missing_data(coordinator) -> None:
     Logs warnings if fetch fails but does not raise exceptions.
     """
     try:
-        now = datetime.now()
+        now = dt_util.now()
         # SFPUC has ~2 day data lag
-        end_date_available = now - timedelta(days=2)
-
-        # Check if we need to update (run every 12 hours)
-        if coordinator._last_backfill_date and (
-            now - coordinator._last_backfill_date
-        ) < timedelta(hours=12):
+        end_date_available = _portal_time(now) - timedelta(days=2)
+
+        # Check if we need to update (run every 12 hours). Within a run the
+        # monotonic clock can't be moved by NTP or DST changes; the wall-clock
+        # time restored from storage only covers the first run after a restart
+        if coordinator._last_backfill_monotonic is not None:
+            if (
+                time.monotonic() - coordinator._last_backfill_monotonic
+                < _BACKFILL_INTERVAL.total_seconds()
+            ):
+                return
+        elif (
+            coordinator._last_backfill_date
+            and now - coordinator._last_backfill_date < _BACKFILL_INTERVAL
+        ):
             return
 
         coordinator.logger.debug("Fetching new hourly data since last update...")
@@ -316,12 +469,7 @@ async def async_backfill_missing_data(coordinator) -> None:
         # Get the latest statistic timestamp from database
         from homeassistant.components.recorder.statistics import get_last_statistics
 
-        safe_account = (
-            coordinator.config_entry.data.get(CONF_USERNAME, "unknown")
-            .replace("-", "_")
-            .lower()
-        )
-        stat_id = f"{DOMAIN}:{safe_account}_water_consumption"
+        stat_id = coordinator.stat_id
 
         last_stat = await get_instance(coordinator.hass).async_add_executor_job(
             get_last_statistics, coordinator.hass, 1, stat_id, True, set()
@@ -329,14 +477,13 @@ async def async_backfill_missing_data(coordinator) -> None:
 
         # Determine start date for fetch
         if last_stat and stat_id in last_stat:
-            last_timestamp = last_stat[stat_id][0]["start"]
-            # Convert timestamp to datetime and add 1 hour to avoid duplicate
-            from datetime import datetime as dt
-
-            start_date = dt.fromtimestamp(last_timestamp) + timedelta(hours=1)
+            last_start = _portal_time(
+                dt_util.utc_from_timestamp(last_stat[stat_id][0]["start"])
+            )
+            # Start 1 hour after the latest statistic to avoid a duplicate
+            start_date = last_start + timedelta(hours=1)
             coordinator.logger.debug(
-                "Latest statistic: %s, fetching data since then",
-                dt.fromtimestamp(last_timestamp),
+                "Latest statistic: %s, fetching data since then", last_start
             )
         else:
             # No existing data - skip backfill on first sync
@@ -346,57 +493,32 @@ async def async_backfill_missing_data(coordinator) -> None:
             )
             return
 
-        loop = asyncio.get_event_loop()
-
         # Fetch only NEW hourly data since last statistic (up to 2 days ago)
         coordinator.logger.info(
             f"Fetching new hourly data from {start_date.date()} to {end_date_available.date()}..."
         )
         try:
-            # Fetch hourly data from start_date to end_date_available, one day at a time
-            hourly_data_all = []
-            current_date = start_date
-
-            while current_date.date() <= end_date_available.date():
-                fetch_date = current_date
-
-                # Retry logic for network errors
-                max_retries = 3
-                hourly_chunk = None
-                for attempt in range(max_retries):
-                    try:
-                        hourly_chunk = await loop.run_in_executor(
-                            None,
-                            coordinator.scraper.get_usage_data,
-                            fetch_date,
-                            fetch_date,  # Same day for start and end
-                            "hourly",
-                        )
-                        break  # Success
-                    except Exception as err:
-                        if attempt < max_retries - 1:
-                            coordinator.logger.warning(
-                                "Failed to fetch hourly data for %s (attempt %d/%d): %s, retrying...",
-                                fetch_date.date(),
-                                attempt + 1,
-                                max_retries,
-                                err,
-                            )
-                            await asyncio.sleep(2**attempt)
-                        else:
-                            coordinator.logger.error(
-                                "Failed to fetch hourly data for %s after %d attempts: %s",
-                                fetch_date.date(),
-                                max_retries,
-                                err,
-                            )
-
-                if hourly_chunk:
-                    hourly_data_all.extend(hourly_chunk)
-
-                # Move to next day
-                current_date += timedelta(days=1)
-                await asyncio.sleep(0.5)  # Small delay
+            # Queue every missing day at once; the coordinator sends them one
+            # at a time with its own spacing. Days that fail after retries are
+            # skipped.
+            results = await asyncio.gather(
+                *(
+                    _async_fetch_with_retry(
+                        coordinator,
+                        fetch_date,
+                        fetch_date,  # Same day for start and end
+                        "hourly",
+                    )
+                    for fetch_date in _day_schedule(start_date, end_date_available)
+                ),
+                return_exceptions=True,
+            )
+            hourly_data_all = [
+                point
+                for hourly_chunk in results
+                if isinstance(hourly_chunk, list)
+                for point in hourly_chunk
+            ]
 
             if hourly_data_all:
                 await async_insert_statistics(coordinator, hourly_data_all)
@@ -409,6 +531,8 @@ async def async_backfill_missing_data(coordinator) -> None:
             coordinator.logger.warning("Failed to fetch new hourly data: %s", err)
 
         coordinator._last_backfill_date = now
+        coordinator._last_backfill_monotonic = time.monotonic()
+        await coordinator.async_save_state()
 
     except Exception as err:
         coordinator.logger.warning("Failed to update with new data: %s", err)
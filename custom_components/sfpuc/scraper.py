@@ -1,14 +1,182 @@
 """SFPUC web scraper for water usage data."""
 
+import codecs
+import csv
 from datetime import datetime
+import html
+from importlib.util import find_spec
 import logging
+import re
+import time
 from typing import Any, cast
 
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 _LOGGER = logging.getLogger(__name__)
 
+# Only <input> elements are needed from portal pages (ASP.NET form tokens)
+_INPUT_STRAINER = SoupStrainer("input")
+# ASP.NET renders form fields as <input ... name="..." ... value="..." />
+_INPUT_TAG_RE = re.compile(rb"<input\b[^>]*>", re.IGNORECASE)
+_INPUT_ATTR_RE = re.compile(rb'\s(name|value)\s*=\s*"([^"]*)"', re.IGNORECASE)
+
+# Month abbreviations used in monthly exports ("Dec 23"); a dict lookup is
+# much cheaper than strptime and doesn't depend on the host locale
+_MONTH_ABBREVIATIONS = {
+    "jan": 1,
+    "feb": 2,
+    "mar": 3,
+    "apr": 4,
+    "may": 5,
+    "jun": 6,
+    "jul": 7,
+    "aug": 8,
+    "sep": 9,
+    "oct": 10,
+    "nov": 11,
+    "dec": 12,
+}
+
+# Hourly export row labels ("12 AM" ... "11 PM") and their 24-hour clock hour
+_HOUR_LABEL_RE = re.compile(r"(\d{1,2})\s*([AP])M", re.IGNORECASE)
+_HOUR_OF_LABEL = {
+    (hour % 12 or 12, "P" if hour >= 12 else "A"): hour for hour in range(24)
+}
+
+# ASP.NET drops sessions after 20 minutes without a request (the default
+# sessionState timeout); an idle session is treated as logged out
+_SESSION_IDLE_TIMEOUT = 20 * 60
+
+# Field only present on the sign-in form; seeing it means the session expired
+_LOGIN_FORM_MARKER = b"tb_USER_ID"
+
+# Transient portal errors retried by every session's adapter. Only GETs are
+# retried: the login and export POSTs aren't idempotent and are retried by
+# the data fetcher instead. Retry-After is ignored so a 429 can't stall the
+# coordinator's one-at-a-time request queue for as long as the server asks.
+_RETRY_POLICY = Retry(
+    total=3,
+    backoff_factor=0.5,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=frozenset(["GET"]),
+    respect_retry_after_header=False,
+)
+
+# Page text that signals a successful or failed sign-in when the portal
+# doesn't redirect to the account page
+_LOGIN_SUCCESS_MARKERS = (b"Welcome", b"Dashboard", b"Account", b"Usage", b"Logout")
+_LOGIN_FAILURE_MARKERS = (
+    b"Login failed",
+    b"Authentication failed",
+    b"Please try again",
+)
+
+# Mimic a real browser. urllib3 can only decode brotli bodies when a brotli
+# package is installed, so br is advertised only then.
+_DEFAULT_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7",
+    "Accept-Language": "en-US,en;q=0.9",
+    "Accept-Encoding": (
+        "gzip, deflate, br"
+        if find_spec("brotli") or find_spec("brotlicffi")
+        else "gzip, deflate"
+    ),
+    "DNT": "1",
+    "Connection": "keep-alive",
+    "Upgrade-Insecure-Requests": "1",
+}
+
+
+def _extract_form_inputs(content: bytes) -> dict[str, str]:
+    """Extract named <input> values from a portal page.
+
+    Scans the raw response bytes with precompiled regexes instead of building
+    a DOM for pages that are mostly ViewState. Falls back to BeautifulSoup if
+    the regexes find nothing, e.g. because the markup changed shape.
+
+    Args:
+        content: Raw HTML of the page.
+
+    Returns:
+        Mapping of input name to its (unescaped) value.
+    """
+    inputs: dict[str, str] = {}
+    for tag in _INPUT_TAG_RE.finditer(content):
+        attrs = {
+            key.lower(): value for key, value in _INPUT_ATTR_RE.findall(tag.group())
+        }
+        name = attrs.get(b"name")
+        if name:
+            inputs[html.unescape(name.decode("utf-8", errors="ignore"))] = (
+                html.unescape(attrs.get(b"value", b"").decode("utf-8", errors="ignore"))
+            )
+
+    if not inputs:
+        soup = BeautifulSoup(content, "lxml", parse_only=_INPUT_STRAINER)
+        for inp in soup.find_all("input"):
+            input_name = inp.get("name")
+            input_value = inp.get("value", "")
+            # name and value are single-valued; only multi-valued attributes
+            # such as class come back as lists
+            if isinstance(input_name, str) and input_name:
+                inputs[input_name] = input_value if isinstance(input_value, str) else ""
+
+    return inputs
+
+
+def _parse_hourly_timestamp(
+    text: str, start_date: datetime, end_date: datetime
+) -> datetime:
+    """Parse an hourly row label such as "12 AM" or "1 PM".
+
+    Hourly rows only carry the hour; they all belong to the requested end
+    date (SFPUC typically shows hourly data up to 2 days ago).
+    """
+    match = _HOUR_LABEL_RE.fullmatch(text)
+    if match is None:
+        raise ValueError(f"Unrecognized hour label: {text}")
+    hour = _HOUR_OF_LABEL[int(match.group(1)), match.group(2).upper()]
+    return datetime(end_date.year, end_date.month, end_date.day, hour)
+
+
+def _parse_daily_timestamp(
+    text: str, start_date: datetime, end_date: datetime
+) -> datetime:
+    """Parse a daily row label "MM/DD", inferring the year from the range."""
+    month, day = map(int, text.split("/"))
+    requested_year = start_date.year
+    timestamp = datetime(requested_year, month, day)
+
+    # Handle year boundaries for cross-year requests
+    if timestamp < start_date and start_date.month == 12 and month == 1:
+        timestamp = datetime(requested_year + 1, month, day)
+    elif timestamp > end_date and end_date.month == 1 and month == 12:
+        timestamp = datetime(requested_year - 1, month, day)
+    return timestamp
+
+
+def _parse_monthly_timestamp(
+    text: str, start_date: datetime, end_date: datetime
+) -> datetime:
+    """Parse a billed-usage row label "Mon YY" (like "Dec 23")."""
+    month_name, year_str = text.split()
+    month = _MONTH_ABBREVIATIONS[month_name[:3].lower()]
+    # Convert 2-digit to 4-digit
+    return datetime(2000 + int(year_str), month, 1)
+
+
+# Row timestamp parser per resolution; each raises ValueError, IndexError or
+# KeyError for a label it can't parse
+_TIMESTAMP_PARSERS = {
+    "hourly": _parse_hourly_timestamp,
+    "daily": _parse_daily_timestamp,
+    "monthly": _parse_monthly_timestamp,
+}
+
 
 class SFPUCScraper:
     """SF PUC water usage data scraper.
@@ -29,21 +197,72 @@ class SFPUCScraper:
         self.username = username
         self.password = password
         self.session = requests.Session()
+        # Keep connections to the portal alive across the login/usage/download
+        # chain and retry transient server errors instead of failing the fetch
+        adapter = HTTPAdapter(
+            pool_connections=4, pool_maxsize=8, max_retries=_RETRY_POLICY
+        )
+        self.session.mount("https://", adapter)
         self.base_url = "https://myaccount-water.sfpuc.org"
-
-        # Mimic a real browser
-        self.session.headers.update(
-            {
-                "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36",
-                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7",
-                "Accept-Language": "en-US,en;q=0.9",
-                "Accept-Encoding": "gzip, deflate, br",
-                "DNT": "1",
-                "Connection": "keep-alive",
-                "Upgrade-Insecure-Requests": "1",
-            }
+        # Monotonic time of the last request made with a logged-in session
+        self._last_activity: float | None = None
+        # Conditional-request headers and form inputs of the last login page
+        # that led to a successful sign-in
+        self._login_form_cache: tuple[dict[str, str], dict[str, str]] | None = None
+        self.session.headers.update(_DEFAULT_HEADERS)
+
+    @property
+    def is_authenticated(self) -> bool:
+        """Return True if the portal session is expected to still be valid.
+
+        True after a successful login until the portal bounces us back to the
+        sign-in form or the session has been idle longer than ASP.NET keeps it.
+        """
+        return (
+            self._last_activity is not None
+            and time.monotonic() - self._last_activity < _SESSION_IDLE_TIMEOUT
         )
 
+    @is_authenticated.setter
+    def is_authenticated(self, value: bool) -> None:
+        """Mark the session as just used (True) or logged out (False)."""
+        self._last_activity = time.monotonic() if value else None
+
+    def close(self) -> None:
+        """Close the HTTP session and release its pooled connections."""
+        self.session.close()
+
+    def _get_login_form(
+        self, login_url: str
+    ) -> tuple[dict[str, str], tuple[dict[str, str], dict[str, str]] | None]:
+        """Fetch the login page's hidden form inputs.
+
+        When the portal sent a Last-Modified or ETag validator for the page,
+        the next fetch is conditional and a 304 reuses the cached inputs
+        instead of downloading and parsing the page again.
+
+        Args:
+            login_url: URL of the sign-in page.
+
+        Returns:
+            The form inputs, and the cache entry to keep if the login succeeds.
+        """
+        cached = self._login_form_cache
+        response = self.session.get(login_url, headers=cached[0] if cached else None)
+        _LOGGER.debug("Login page response status: %s", response.status_code)
+
+        if response.status_code == 304 and cached:
+            _LOGGER.debug("Login page not modified, reusing form tokens")
+            return cached[1], cached
+
+        inputs = _extract_form_inputs(response.content)
+        validators = {}
+        if last_modified := response.headers.get("Last-Modified"):
+            validators["If-Modified-Since"] = last_modified
+        if etag := response.headers.get("ETag"):
+            validators["If-None-Match"] = etag
+        return inputs, (validators, inputs) if validators else None
+
     def login(self) -> bool:
         """Authenticate with SFPUC portal.
 
@@ -55,6 +274,7 @@ class SFPUCScraper:
         Returns:
             True if login was successful, False otherwise.
         """
+        self.is_authenticated = False
         try:
             _LOGGER.debug(
                 "Starting SFPUC login process for user: %s", self.username[:3] + "***"
@@ -63,17 +283,13 @@ class SFPUCScraper:
             # GET the login page to extract ViewState
             login_url = f"{self.base_url}/"
             _LOGGER.debug("Fetching login page: %s", login_url)
-            response = self.session.get(login_url)
-            _LOGGER.debug("Login page response status: %s", response.status_code)
-
-            soup = BeautifulSoup(response.content, "html.parser")
-
-            # Extract hidden form fields
-            viewstate = soup.find("input", {"name": "__VIEWSTATE"})
-            eventvalidation = soup.find("input", {"name": "__EVENTVALIDATION"})
-            viewstate_generator = soup.find("input", {"name": "__VIEWSTATEGENERATOR"})
+            inputs, form_cache = self._get_login_form(login_url)
+            # Only kept once a login with these tokens succeeds
+            self._login_form_cache = None
+            viewstate = inputs.get("__VIEWSTATE")
+            eventvalidation = inputs.get("__EVENTVALIDATION")
 
-            if not viewstate or not eventvalidation:
+            if viewstate is None or eventvalidation is None:
                 _LOGGER.warning("Failed to extract form tokens from login page")
                 return False
 
@@ -83,13 +299,11 @@ class SFPUCScraper:
             login_data = {
                 "__EVENTTARGET": "",
                 "__EVENTARGUMENT": "",
-                "__VIEWSTATE": viewstate["value"],
-                "__VIEWSTATEGENERATOR": (
-                    viewstate_generator["value"] if viewstate_generator else ""
-                ),
+                "__VIEWSTATE": viewstate,
+                "__VIEWSTATEGENERATOR": inputs.get("__VIEWSTATEGENERATOR", ""),
                 "__SCROLLPOSITIONX": "0",
                 "__SCROLLPOSITIONY": "0",
-                "__EVENTVALIDATION": eventvalidation["value"],
+                "__EVENTVALIDATION": eventvalidation,
                 "tb_USER_ID": self.username,
                 "tb_USER_PSWD": self.password,
                 "cb_REMEMBER_ME": "on",
@@ -106,54 +320,41 @@ class SFPUCScraper:
             )
 
             # Check if login successful
-            # Look for indicators of successful login vs failure
+            # Landing on the account page is conclusive, so only scan the body
+            # for indicators of successful login vs failure when it didn't
             if response.status_code == 200:
-                # Check for common success indicators
-                success_indicators = [
-                    "MY_ACCOUNT_RSF.aspx" in response.url,
-                    "Welcome" in response.text,
-                    "Dashboard" in response.text,
-                    "Account" in response.text,
-                    "Usage" in response.text,
-                    "Logout" in response.text,
-                ]
-
-                # Check for failure indicators
-                failure_indicators = [
-                    "Invalid" in response.text and "password" in response.text.lower(),
-                    "Login failed" in response.text,
-                    "Authentication failed" in response.text,
-                    "Error" in response.text and "login" in response.text.lower(),
-                    "Please try again" in response.text,
-                    response.url.endswith("/"),  # Still on login page
-                ]
-
-                success_score = sum(success_indicators)
-                failure_score = sum(failure_indicators)
+                if "MY_ACCOUNT_RSF.aspx" in response.url:
+                    succeeded, failed = True, False
+                else:
+                    # Search the raw bytes; each check stops at its first hit
+                    body = response.content
+                    failed = (
+                        response.url.endswith("/")  # Still on login page
+                        or any(marker in body for marker in _LOGIN_FAILURE_MARKERS)
+                        or (b"Invalid" in body and b"password" in body.lower())
+                        or (b"Error" in body and b"login" in body.lower())
+                    )
+                    succeeded = any(marker in body for marker in _LOGIN_SUCCESS_MARKERS)
 
                 _LOGGER.debug(
-                    "Login analysis - Success indicators: %d, Failure indicators: %d",
-                    success_score,
-                    failure_score,
+                    "Login analysis - Success indicators: %s, Failure indicators: %s",
+                    succeeded,
+                    failed,
                 )
                 _LOGGER.debug("Response URL: %s", response.url)
-                _LOGGER.debug(
-                    "Response contains 'Welcome': %s", "Welcome" in response.text
-                )
-                _LOGGER.debug(
-                    "Response contains 'Invalid': %s", "Invalid" in response.text
-                )
 
-                if success_score > 0 and failure_score == 0:
+                if succeeded and not failed:
                     _LOGGER.info(
                         "SFPUC login successful for user: %s", self.username[:3] + "***"
                     )
+                    self.is_authenticated = True
+                    self._login_form_cache = form_cache
                     return True
                 else:
                     _LOGGER.warning(
-                        "SFPUC login failed - success_score: %d, failure_score: %d",
-                        success_score,
-                        failure_score,
+                        "SFPUC login failed - success indicators: %s, failure indicators: %s",
+                        succeeded,
+                        failed,
                     )
                     return False
             else:
@@ -184,7 +385,14 @@ class SFPUCScraper:
             resolution: Data resolution - "hourly", "daily", or "monthly"
 
         Returns:
-            List of usage data points with timestamps and values
+            List of usage data points with timestamps and values, or None if
+            the portal answered without an export (e.g. it rejected the date
+            range). When the portal answers with its sign-in form,
+            is_authenticated is cleared so the caller can log in again.
+
+        Raises:
+            requests.RequestException: If the portal could not be reached,
+                after the session adapter's own retries.
         """
         if end_date is None:
             end_date = start_date
@@ -216,16 +424,13 @@ class SFPUCScraper:
             response = self.session.get(usage_url)
             _LOGGER.debug("Usage page response status: %s", response.status_code)
 
-            soup = BeautifulSoup(response.content, "html.parser")
+            if _LOGIN_FORM_MARKER in response.content:
+                _LOGGER.info("SFPUC session expired - login required")
+                self.is_authenticated = False
+                return None
 
             # Extract form tokens
-            tokens = {}
-            form = soup.find("form")
-            if form:
-                for inp in form.find_all("input"):
-                    name = inp.get("name")
-                    if name:
-                        tokens[name] = inp.get("value", "")
+            tokens = _extract_form_inputs(response.content)
 
             _LOGGER.debug("Extracted %d form tokens", len(tokens))
 
@@ -247,8 +452,10 @@ class SFPUCScraper:
             else:
                 download_url = f"{self.base_url}/USE_{resolution.upper()}.aspx"
             _LOGGER.debug("Triggering Excel download from: %s", download_url)
+            # Stream the export so it is parsed line by line rather than
+            # buffered and decoded as one string
             response = self.session.post(
-                download_url, data=tokens, allow_redirects=True
+                download_url, data=tokens, allow_redirects=True, stream=True
             )
             _LOGGER.debug(
                 "Download response status: %s, URL: %s",
@@ -256,130 +463,85 @@ class SFPUCScraper:
                 response.url,
             )
 
-            if "TRANSACTIONS_EXCEL_DOWNLOAD.aspx" in response.url:
-                # Parse the Excel data
-                content = response.content.decode("utf-8", errors="ignore")
-                lines = content.split("\n")
-                _LOGGER.debug("Downloaded content has %d lines", len(lines))
-
-                usage_data = []
-                for line in lines[1:]:  # Skip header
-                    if line.strip():
-                        parts = line.split("\t")
-                        if len(parts) >= 2:
-                            try:
-                                # Parse timestamp and usage
-                                timestamp_str = parts[0].strip()
-                                usage = float(parts[1])
-
-                                # Parse timestamp based on resolution
-                                if resolution == "hourly":
-                                    # SFPUC hourly format: "12 AM", "1 PM", etc.
-                                    try:
-                                        hour_str, am_pm = timestamp_str.split()
-                                        am_pm = am_pm.upper()
-                                        hour = int(hour_str)
-                                        if am_pm == "PM" and hour != 12:
-                                            hour += 12
-                                        elif am_pm == "AM" and hour == 12:
-                                            hour = 0
-                                        # Use the requested end_date for hourly data
-                                        # SFPUC typically shows hourly data up to 2 days ago
-                                        request_date = end_date.date()
-                                        timestamp = datetime.combine(
-                                            request_date,
-                                            datetime.min.time().replace(hour=hour),
-                                        )
-                                    except (ValueError, IndexError):
-                                        _LOGGER.debug(
-                                            "Failed to parse hourly timestamp: %s",
-                                            timestamp_str,
-                                        )
-                                        continue
-
-                                elif resolution == "daily":
-                                    # SFPUC daily format: "MM/DD" (no year)
-                                    try:
-                                        month, day = map(int, timestamp_str.split("/"))
-                                        # Infer year from requested date range
-                                        requested_year = start_date.year
-                                        timestamp = datetime(requested_year, month, day)
-
-                                        # Handle year boundaries for cross-year requests
-                                        if (
-                                            timestamp < start_date
-                                            and start_date.month == 12
-                                            and month == 1
-                                        ):
-                                            timestamp = datetime(
-                                                requested_year + 1, month, day
-                                            )
-                                        elif (
-                                            timestamp > end_date
-                                            and end_date.month == 1
-                                            and month == 12
-                                        ):
-                                            timestamp = datetime(
-                                                requested_year - 1, month, day
-                                            )
-                                    except (ValueError, IndexError):
-                                        _LOGGER.debug(
-                                            "Failed to parse daily timestamp: %s",
-                                            timestamp_str,
-                                        )
-                                        continue
-
-                                elif resolution == "monthly":
-                                    # SFPUC monthly format: "Mon YY" (like "Dec 23")
-                                    try:
-                                        month_name, year_str = timestamp_str.split()
-                                        month = datetime.strptime(
-                                            month_name, "%b"
-                                        ).month
-                                        year = 2000 + int(
-                                            year_str
-                                        )  # Convert 2-digit to 4-digit
-                                        timestamp = datetime(year, month, 1)
-                                    except (ValueError, IndexError):
-                                        _LOGGER.debug(
-                                            "Failed to parse monthly timestamp: %s",
-                                            timestamp_str,
-                                        )
-                                        continue
-
-                                usage_data.append(
-                                    {
-                                        "timestamp": timestamp,
-                                        "usage": usage,
-                                        "resolution": resolution,
-                                    }
-                                )
-                            except (ValueError, IndexError) as e:
-                                _LOGGER.debug(
-                                    "Failed to parse line: %s, error: %s",
-                                    line.strip(),
-                                    e,
-                                )
-                                continue
-
-                if usage_data:
-                    dates: list[datetime] = [
-                        cast(datetime, item["timestamp"]) for item in usage_data
-                    ]
-                    _LOGGER.info(
-                        "Successfully parsed %d %s data points (from %s to %s)",
-                        len(usage_data),
-                        resolution,
-                        min(dates).strftime("%Y-%m-%d") if dates else "N/A",
-                        max(dates).strftime("%Y-%m-%d") if dates else "N/A",
+            try:
+                if "TRANSACTIONS_EXCEL_DOWNLOAD.aspx" in response.url:
+                    # Parse the Excel data (tab-separated text with a header row)
+                    lines = codecs.iterdecode(
+                        response.iter_lines(), "utf-8", errors="ignore"
                     )
+                    reader = csv.reader(lines, delimiter="\t")
+                    next(reader, None)  # Skip header
+
+                    # Pick the row timestamp parser once for the whole export
+                    parse_timestamp = _TIMESTAMP_PARSERS[resolution]
+
+                    usage_data = []
+                    for parts in reader:
+                        if len(parts) < 2:
+                            continue
+
+                        timestamp_str = parts[0].strip()
+                        if not timestamp_str:
+                            continue
+
+                        try:
+                            usage = float(parts[1])
+                        except ValueError:
+                            _LOGGER.debug(
+                                "Failed to parse usage value: %s", "\t".join(parts)
+                            )
+                            continue
+
+                        try:
+                            timestamp = parse_timestamp(
+                                timestamp_str, start_date, end_date
+                            )
+                        except (ValueError, IndexError, KeyError):
+                            _LOGGER.debug(
+                                "Failed to parse %s timestamp: %s",
+                                resolution,
+                                timestamp_str,
+                            )
+                            continue
+
+                        usage_data.append(
+                            {
+                                "timestamp": timestamp,
+                                "usage": usage,
+                                "resolution": resolution,
+                            }
+                        )
+
+                    if usage_data:
+                        dates: list[datetime] = [
+                            cast(datetime, item["timestamp"]) for item in usage_data
+                        ]
+                        _LOGGER.info(
+                            "Successfully parsed %d %s data points (from %s to %s)",
+                            len(usage_data),
+                            resolution,
+                            min(dates).strftime("%Y-%m-%d") if dates else "N/A",
+                            max(dates).strftime("%Y-%m-%d") if dates else "N/A",
+                        )
+                    else:
+                        _LOGGER.info("Successfully parsed 0 %s data points", resolution)
+                    # The download kept the session alive
+                    self.is_authenticated = True
+                    return usage_data
                 else:
-                    _LOGGER.info("Successfully parsed 0 %s data points", resolution)
-                return usage_data
-            else:
-                _LOGGER.warning("Download failed - unexpected URL: %s", response.url)
-                return None
-
+                    _LOGGER.warning(
+                        "Download failed - unexpected URL: %s", response.url
+                    )
+                    return None
+            finally:
+                # Release the streamed connection back to the pool
+                response.close()
+
+        except requests.RequestException as e:
+            # Transport errors are not an answer about the range; let the
+            # caller retry them rather than treat them like a refused export
+            _LOGGER.warning("Network error during %s data retrieval: %s", resolution, e)
+            raise
         except Exception as e:
             _LOGGER.error(
                 "Exception during %s data retrieval for user %s: %s",
@@ -396,6 +558,9 @@ class SFPUCScraper:
 
         Returns:
             Total water usage for today in gallons, or None if data retrieval fails.
+
+        Raises:
+            requests.RequestException: If the portal could not be reached.
         """
         today = datetime.now()
         data = self.get_usage_data(today, today, "hourly")
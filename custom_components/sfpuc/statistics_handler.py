@@ -1,23 +1,19 @@
 """Statistics handling utilities for SFPUC coordinator."""
 
+from datetime import datetime, timedelta
 from typing import Any
 import zoneinfo
 
 from homeassistant.components.recorder import get_instance
-from homeassistant.components.recorder.models import (
-    StatisticData,
-    StatisticMeanType,
-    StatisticMetaData,
-)
+from homeassistant.components.recorder.models import StatisticData
 from homeassistant.components.recorder.statistics import (
     async_add_external_statistics,
     statistics_during_period,
 )
 from homeassistant.components.recorder.util import DATA_INSTANCE
-from homeassistant.const import UnitOfVolume
 from homeassistant.util import dt as dt_util
 
-from .const import CONF_USERNAME, DOMAIN
+from .const import CONF_USERNAME
 
 
 async def async_insert_statistics(
@@ -26,8 +22,7 @@ async def async_insert_statistics(
     """Insert water usage statistics into Home Assistant.
 
     Handles both legacy (float) and new (list) data formats.
-    Groups data points by resolution and delegates to appropriate
-    resolution-specific insertion methods.
+    Lists may mix resolutions; they are inserted together in one batch.
 
     Args:
         usage_data: Either a float representing daily usage (legacy format)
@@ -54,37 +49,25 @@ async def async_insert_statistics(
             "Processing %d data points for statistics insertion", len(usage_data)
         )
 
-        # Group data by resolution (skip monthly data)
-        hourly_data = []
-        daily_data = []
-        monthly_data = []  # Enabled - billing cycles are now supported
-
-        for item in usage_data:
-            resolution = item.get("resolution", "daily")
-            if resolution == "hourly":
-                hourly_data.append(item)
-            elif resolution == "daily":
-                daily_data.append(item)
-            elif resolution == "monthly":
-                monthly_data.append(item)
+        # All resolutions feed the same statistic, so mixed lists (e.g. a
+        # whole historical fetch) are inserted in a single pass; each point is
+        # normalized by its own resolution
+        data_points = [
+            item
+            for item in usage_data
+            if item.get("resolution", "daily") in ("hourly", "daily", "monthly")
+        ]
+        if not data_points:
+            coordinator.logger.debug("No usage data with a known resolution")
+            return
 
-        coordinator.logger.debug(
-            "Grouped data - Hourly: %d, Daily: %d, Monthly: %d",
-            len(hourly_data),
-            len(daily_data),
-            len(monthly_data),
+        resolutions = {item.get("resolution", "daily") for item in data_points}
+        await async_insert_resolution_statistics(
+            coordinator,
+            data_points,
+            resolutions.pop() if len(resolutions) == 1 else "mixed",
         )
 
-        # Insert statistics for each resolution
-        if hourly_data:
-            await async_insert_resolution_statistics(coordinator, hourly_data, "hourly")
-        if daily_data:
-            await async_insert_resolution_statistics(coordinator, daily_data, "daily")
-        if monthly_data:
-            await async_insert_resolution_statistics(
-                coordinator, monthly_data, "monthly"
-            )
-
     except Exception as err:
         coordinator.logger.warning("Failed to insert water usage statistics: %s", err)
 
@@ -101,8 +84,9 @@ async def async_insert_resolution_statistics(
     Args:
         data_points: List of dictionaries with 'timestamp' and 'usage' keys.
                     Timestamps should be timezone-naive (assumed local to SF).
-        resolution: Data resolution - 'hourly' or 'daily'. Determines statistic ID
-                   and metadata.
+        resolution: Default resolution for points without their own
+                   'resolution' key ("daily" when it is "mixed"); also
+                   used in log messages.
 
     Logs warnings if insertion fails but does not raise exceptions.
     """
@@ -111,49 +95,59 @@ async def async_insert_resolution_statistics(
             "Inserting %d %s statistics", len(data_points), resolution
         )
 
-        # Sort data points by timestamp to ensure correct cumulative sum calculation
-        data_points = sorted(data_points, key=lambda x: x["timestamp"])
+        # Normalize each point to its period start in UTC and deduplicate by
+        # that start (keep last occurrence to get most recent data)
+        sf_timezone = zoneinfo.ZoneInfo("America/Los_Angeles")
+        usage_by_start: dict[datetime, float] = {}
 
-        # Deduplicate by timestamp (keep last occurrence to get most recent data)
-        seen_timestamps = {}
         for point in data_points:
-            timestamp_key = point["timestamp"]
-            seen_timestamps[timestamp_key] = point
+            timestamp = point["timestamp"]
+            # A "mixed" batch has no single resolution to fall back on; use
+            # the same default as the filter in async_insert_statistics
+            point_resolution = point.get(
+                "resolution", "daily" if resolution == "mixed" else resolution
+            )
 
-        # Convert back to list, maintaining sorted order
-        data_points = list(seen_timestamps.values())
-        data_points.sort(key=lambda x: x["timestamp"])
+            # Adjust timestamp based on resolution
+            if point_resolution == "hourly":
+                start_time = timestamp
+            elif point_resolution == "daily":
+                start_time = timestamp.replace(
+                    hour=0, minute=0, second=0, microsecond=0
+                )
+            elif point_resolution == "monthly":
+                start_time = timestamp.replace(
+                    day=1, hour=0, minute=0, second=0, microsecond=0
+                )
+            else:
+                coordinator.logger.debug(
+                    "Skipping data point with unknown resolution: %s",
+                    point_resolution,
+                )
+                continue
+
+            # Convert naive timestamp to timezone-aware UTC (HA stores statistics in UTC)
+            if start_time.tzinfo is None:
+                # Treat naive timestamp as San Francisco local time
+                # Localize to SF timezone, then convert to UTC
+                start_time = dt_util.as_utc(start_time.replace(tzinfo=sf_timezone))
+            else:
+                # Already timezone-aware, convert to UTC
+                start_time = dt_util.as_utc(start_time)
+
+            usage_by_start[start_time] = point["usage"]
 
         coordinator.logger.debug(
-            "After deduplication: %d %s statistics", len(data_points), resolution
+            "After deduplication: %d %s statistics", len(usage_by_start), resolution
         )
 
-        # Create statistic metadata based on resolution
         # Use SINGLE statistic ID for all resolutions
         # This consolidates hourly, daily, and monthly data into one statistic
-        account_number = coordinator.config_entry.data.get(CONF_USERNAME, "default")
-        # Sanitize account number (lowercase, replace special chars)
-        safe_account = account_number.lower().replace("-", "_").replace(" ", "_")
-
-        # Use a valid statistic_id for external statistics
-        stat_id = f"{DOMAIN}:{safe_account}_water_consumption"
-        name = "San Francisco Water Power Sewer"
-        has_sum = True
-
-        metadata = StatisticMetaData(
-            has_sum=has_sum,
-            mean_type=StatisticMeanType.NONE,
-            name=name,
-            source=DOMAIN,
-            statistic_id=stat_id,
-            unit_class="volume",
-            unit_of_measurement=UnitOfVolume.GALLONS.value,
-        )
+        stat_id = coordinator.stat_id
+        metadata = coordinator.statistic_metadata
 
         # Get existing statistics to detect duplicates and continue cumulative sum
         # Query the past 3 years to cover all potential overlaps
-        from datetime import timedelta
-
         end_time = dt_util.now()
         start_time_query = end_time - timedelta(days=365 * 3)
 
@@ -199,35 +193,8 @@ async def async_insert_resolution_statistics(
         statistic_data = []
         skipped_older_than_existing = 0
 
-        for point in data_points:
-            timestamp = point["timestamp"]
-            usage = point["usage"]
-
-            # Adjust timestamp based on resolution
-            if resolution == "hourly":
-                start_time = timestamp
-            elif resolution == "daily":
-                start_time = timestamp.replace(
-                    hour=0, minute=0, second=0, microsecond=0
-                )
-            elif resolution == "monthly":
-                start_time = timestamp.replace(
-                    day=1, hour=0, minute=0, second=0, microsecond=0
-                )
-
-            # Convert naive timestamp to timezone-aware UTC (HA stores statistics in UTC)
-            if start_time.tzinfo is None:
-                # Treat naive timestamp as San Francisco local time
-                # Localize to SF timezone, then convert to UTC
-                sf_timezone = zoneinfo.ZoneInfo("America/Los_Angeles")
-                # Create a new aware datetime by interpreting the naive time as SF local time
-                start_time_aware = start_time.replace(tzinfo=sf_timezone)
-                # Convert to UTC
-                start_time = dt_util.as_utc(start_time_aware)
-            else:
-                # Already timezone-aware, convert to UTC
-                start_time = dt_util.as_utc(start_time)
-
+        # Sorted by start so the cumulative sum is built in chronological order
+        for start_time, usage in sorted(usage_by_start.items()):
             # Skip exact duplicate timestamps (already in database)
             if start_time.timestamp() in existing_timestamps:
                 coordinator.logger.debug(
@@ -321,20 +288,8 @@ async def async_insert_legacy_statistics(coordinator, daily_usage: float) -> Non
     Logs warnings if insertion fails but does not raise exceptions.
     """
     try:
-        # Create statistic metadata for daily water usage
         # Use unified statistic ID (same as all other resolutions)
-        account_number = coordinator.config_entry.data.get(CONF_USERNAME, "default")
-        # Sanitize account number (lowercase, replace special chars)
-        safe_account = account_number.lower().replace("-", "_").replace(" ", "_")
-        metadata = StatisticMetaData(
-            has_sum=True,
-            mean_type=StatisticMeanType.NONE,
-            name="San Francisco Water Power Sewer",
-            source=DOMAIN,
-            statistic_id=f"{DOMAIN}:{safe_account}_water_consumption",
-            unit_class="volume",
-            unit_of_measurement=UnitOfVolume.GALLONS.value,
-        )
+        metadata = coordinator.statistic_metadata
 
         # Get current date for the statistic
         now = dt_util.now()
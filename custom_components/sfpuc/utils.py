@@ -7,14 +7,19 @@ from homeassistant.components.recorder import get_instance
 from homeassistant.components.recorder.statistics import statistics_during_period
 from homeassistant.util import dt as dt_util
 
-from .const import CONF_USERNAME, DOMAIN
 
-
-def calculate_billing_period(coordinator) -> tuple[datetime, datetime]:
+def calculate_billing_period(
+    coordinator, now: datetime | None = None
+) -> tuple[datetime, datetime]:
     """Calculate current SFPUC billing period dates.
 
     Uses billing day detected from monthly data, or defaults to 25th.
 
+    Args:
+        now: Reference time for the period; defaults to the current time.
+             Pass the refresh's timezone-aware time so the boundaries fall
+             on local midnight.
+
     Returns:
         Tuple of (bill_start_date, bill_end_date)
     """
@@ -24,7 +29,7 @@ def calculate_billing_period(coordinator) -> tuple[datetime, datetime]:
         coordinator._billing_day if coordinator._billing_day is not None else 25
     )
 
-    today = datetime.now()
+    today = now if now is not None else datetime.now()
     current_month_bill_date = today.replace(
         day=billing_day, hour=0, minute=0, second=0, microsecond=0
     )
@@ -63,12 +68,7 @@ async def async_detect_billing_day(coordinator) -> int:
 
     try:
         # Query monthly statistics to detect billing pattern
-        safe_account = (
-            coordinator.config_entry.data.get(CONF_USERNAME, "unknown")
-            .replace("-", "_")
-            .lower()
-        )
-        stat_id = f"{DOMAIN}:{safe_account}_water_consumption"
+        stat_id = coordinator.stat_id
 
         # Get last 3 months of billing data
         three_months_ago = datetime.now() - timedelta(days=90)
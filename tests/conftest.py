@@ -15,20 +15,30 @@ def config_entry():
 
 
 @pytest.fixture
-def mock_scraper():
-    """Create a mock SFPUC scraper."""
-    with patch("custom_components.sfpuc.coordinator.SFPUCScraper") as mock:
-        scraper = Mock()
-        mock.return_value = scraper
-        scraper.login.return_value = True
-        scraper.get_usage_data.return_value = [
-            {
-                "timestamp": datetime(2023, 10, 1, 10, 0),
-                "usage": 50.0,
-                "resolution": "hourly",
-            }
-        ]
-        yield scraper
+def coordinator(hass, config_entry):
+    """Create a coordinator for the mock config entry."""
+    from custom_components.sfpuc.coordinator import SFWaterCoordinator
+
+    return SFWaterCoordinator(hass, config_entry)
+
+
+@pytest.fixture
+def mock_scraper(monkeypatch):
+    """Create a mock SFPUC scraper used by every coordinator built in the test."""
+    scraper = Mock()
+    monkeypatch.setattr(
+        "custom_components.sfpuc.coordinator.SFPUCScraper", Mock(return_value=scraper)
+    )
+    scraper.login.return_value = True
+    scraper.is_authenticated = False
+    scraper.get_usage_data.return_value = [
+        {
+            "timestamp": datetime(2023, 10, 1, 10, 0),
+            "usage": 50.0,
+            "resolution": "hourly",
+        }
+    ]
+    return scraper
 
 
 @pytest.fixture
@@ -1,5 +1,7 @@
 """Tests for San Francisco Water Power Sewer config flow."""
 
+from unittest.mock import Mock, patch
+
 from homeassistant.data_entry_flow import FlowResultType
 import pytest
 
@@ -30,6 +32,25 @@ class TestSFWaterConfigFlow:
         assert "username" in result["data_schema"].schema
         assert "password" in result["data_schema"].schema
 
+    @pytest.mark.asyncio
+    async def test_config_flow_closes_validation_session(self, hass):
+        """Test the scraper used to validate credentials is closed."""
+        flow = ConfigFlowHandler()
+        flow.hass = hass
+
+        with patch("custom_components.sfpuc.config_flow.SFPUCScraper") as mock_class:
+            scraper = Mock()
+            scraper.login.return_value = False
+            mock_class.return_value = scraper
+
+            result = await flow.async_step_user(
+                {"username": "test@example.com", "password": "wrong"}
+            )
+
+        assert result["type"] == FlowResultType.FORM
+        assert result["errors"] == {"base": "invalid_auth"}
+        scraper.close.assert_called_once()
+
     def test_config_flow_get_options_flow(self, hass):
         """Test getting the options flow."""
         config_entry = MockConfigEntry()
@@ -1,16 +1,16 @@
 """Tests for San Francisco Water Power Sewer coordinator."""
 
-from datetime import timedelta
+import asyncio
+from datetime import datetime, timedelta
 from unittest.mock import AsyncMock, Mock, patch
 
 from homeassistant.helpers.update_coordinator import UpdateFailed
+from homeassistant.util import dt as dt_util
 import pytest
 
-from custom_components.sfpuc.const import DEFAULT_UPDATE_INTERVAL
+from custom_components.sfpuc.const import DEFAULT_UPDATE_INTERVAL, MIN_REQUEST_INTERVAL
 from custom_components.sfpuc.coordinator import SFWaterCoordinator
 
-from .common import MockConfigEntry
-
 
 class TestSFWaterCoordinator:
     """Test the San Francisco Water Power Sewer coordinator functionality."""
@@ -18,8 +18,6 @@ class TestSFWaterCoordinator:
     @pytest.fixture(autouse=True)
     def setup_method(self, hass):
         """Set up test fixtures."""
-        self.hass = hass
-        self.config_entry = MockConfigEntry()
         # Add recorder instance to hass.data for statistics insertion
         from homeassistant.components.recorder.util import DATA_INSTANCE
 
@@ -46,6 +44,11 @@ class TestSFWaterCoordinator:
         assert coordinator.config_entry == config_entry
         assert coordinator._last_backfill_date is None
         assert coordinator._historical_data_fetched is False
+        assert coordinator.last_updated is None
+        assert coordinator.always_update is False
+        assert coordinator.stat_id.startswith("sfpuc:")
+        assert coordinator.statistic_metadata["statistic_id"] == coordinator.stat_id
+        assert coordinator.statistic_metadata["has_sum"] is True
         assert coordinator.update_interval == timedelta(minutes=DEFAULT_UPDATE_INTERVAL)
 
     @patch("custom_components.sfpuc.coordinator.SFPUCScraper")
@@ -58,6 +61,7 @@ class TestSFWaterCoordinator:
         mock_scraper = Mock()
         mock_scraper_class.return_value = mock_scraper
         mock_scraper.login.return_value = True
+        mock_scraper.is_authenticated = False
 
         coordinator = SFWaterCoordinator(hass, config_entry)
 
@@ -100,7 +104,8 @@ class TestSFWaterCoordinator:
             result = await coordinator._async_update_data()
 
         assert result["current_bill_usage"] == 140.0  # Sum of the states
-        assert "last_updated" in result
+        assert "last_updated" not in result
+        assert coordinator.last_updated is not None
         assert (
             coordinator._historical_data_fetched is False
         )  # Background task scheduled, not completed
@@ -123,6 +128,7 @@ class TestSFWaterCoordinator:
         mock_scraper = Mock()
         mock_scraper_class.return_value = mock_scraper
         mock_scraper.login.return_value = False
+        mock_scraper.is_authenticated = False
 
         coordinator = SFWaterCoordinator(hass, config_entry)
 
@@ -149,6 +155,7 @@ class TestSFWaterCoordinator:
         mock_scraper = Mock()
         mock_scraper_class.return_value = mock_scraper
         mock_scraper.login.return_value = True
+        mock_scraper.is_authenticated = False
         mock_scraper.get_usage_data.return_value = None
 
         coordinator = SFWaterCoordinator(hass, config_entry)
@@ -184,7 +191,8 @@ class TestSFWaterCoordinator:
             result = await coordinator._async_update_data()
 
         assert result["current_bill_usage"] == 0.0
-        assert "last_updated" in result
+        assert "last_updated" not in result
+        assert coordinator.last_updated is not None
 
     @patch("custom_components.sfpuc.coordinator.SFPUCScraper")
     @pytest.mark.asyncio
@@ -233,3 +241,241 @@ class TestSFWaterCoordinator:
 
             # Coordinator should still be functional
             assert coordinator is not None
+
+    @patch("custom_components.sfpuc.coordinator.SFPUCScraper")
+    @pytest.mark.asyncio
+    async def test_update_data_reuses_session(
+        self, mock_scraper_class, hass, config_entry
+    ):
+        """Test an authenticated session is reused without logging in again."""
+        mock_scraper = Mock()
+        mock_scraper_class.return_value = mock_scraper
+        mock_scraper.is_authenticated = True
+
+        coordinator = SFWaterCoordinator(hass, config_entry)
+
+        with (
+            patch(
+                "homeassistant.components.recorder.get_instance"
+            ) as mock_get_instance,
+            patch(
+                "custom_components.sfpuc.coordinator.async_backfill_missing_data",
+                AsyncMock(),
+            ),
+            patch(
+                "custom_components.sfpuc.coordinator.async_check_has_historical_data",
+                AsyncMock(return_value=True),
+            ),
+            patch(
+                "custom_components.sfpuc.coordinator.async_detect_billing_day",
+                AsyncMock(),
+            ),
+        ):
+            mock_recorder = Mock()
+            mock_recorder.async_add_executor_job = AsyncMock(return_value={})
+            mock_get_instance.return_value = mock_recorder
+            await coordinator._async_update_data()
+
+        mock_scraper.login.assert_not_called()
+
+    @patch("custom_components.sfpuc.coordinator.SFPUCScraper")
+    @pytest.mark.asyncio
+    async def test_get_usage_data_relogin_on_expired_session(
+        self, mock_scraper_class, hass, config_entry
+    ):
+        """Test an expired session triggers one login and a retried fetch."""
+        mock_scraper = Mock()
+        mock_scraper_class.return_value = mock_scraper
+        usage = [
+            {
+                "timestamp": datetime(2023, 10, 1, 10, 0),
+                "usage": 50.0,
+                "resolution": "hourly",
+            }
+        ]
+        mock_scraper.get_usage_data.side_effect = [None, usage]
+        mock_scraper.is_authenticated = False
+        mock_scraper.login.return_value = True
+
+        coordinator = SFWaterCoordinator(hass, config_entry)
+        start = datetime(2023, 10, 1)
+
+        with (
+            patch("homeassistant.helpers.issue_registry.async_delete_issue"),
+            patch("asyncio.sleep", new_callable=AsyncMock),
+        ):
+            result = await coordinator.async_get_usage_data(start, start, "hourly")
+
+        assert result == usage
+        mock_scraper.login.assert_called_once()
+        assert mock_scraper.get_usage_data.call_count == 2
+
+    @patch("custom_components.sfpuc.coordinator.SFPUCScraper")
+    @pytest.mark.asyncio
+    async def test_get_usage_data_spaces_requests(
+        self, mock_scraper_class, hass, config_entry
+    ):
+        """Test back-to-back portal requests wait for the minimum interval."""
+        mock_scraper = Mock()
+        mock_scraper_class.return_value = mock_scraper
+        mock_scraper.get_usage_data.return_value = []
+
+        coordinator = SFWaterCoordinator(hass, config_entry)
+
+        with patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+            await coordinator.async_get_usage_data(
+                datetime(2023, 10, 1), datetime(2023, 10, 1), "hourly"
+            )
+            mock_sleep.assert_not_called()
+
+            await coordinator.async_get_usage_data(
+                datetime(2023, 10, 2), datetime(2023, 10, 2), "hourly"
+            )
+
+        mock_sleep.assert_awaited_once()
+        assert 0 < mock_sleep.call_args[0][0] <= MIN_REQUEST_INTERVAL
+
+    @patch("custom_components.sfpuc.coordinator.SFPUCScraper")
+    @pytest.mark.asyncio
+    async def test_update_data_schedules_historical_fetch_once(
+        self, mock_scraper_class, hass, config_entry
+    ):
+        """Test the historical fetch isn't rescheduled while running or too soon."""
+        mock_scraper = Mock()
+        mock_scraper_class.return_value = mock_scraper
+        mock_scraper.is_authenticated = True
+
+        coordinator = SFWaterCoordinator(hass, config_entry)
+        running_task = Mock()
+        running_task.done.return_value = False
+
+        with (
+            patch(
+                "homeassistant.components.recorder.get_instance"
+            ) as mock_get_instance,
+            patch(
+                "custom_components.sfpuc.coordinator.async_backfill_missing_data",
+                AsyncMock(),
+            ),
+            patch(
+                "custom_components.sfpuc.coordinator.async_check_has_historical_data",
+                AsyncMock(return_value=False),
+            ),
+            patch(
+                "custom_components.sfpuc.coordinator.async_detect_billing_day",
+                AsyncMock(),
+            ),
+            patch(
+                "custom_components.sfpuc.coordinator.async_background_historical_fetch",
+                Mock(),
+            ),
+            patch("asyncio.create_task", return_value=running_task) as mock_create_task,
+        ):
+            mock_recorder = Mock()
+            mock_recorder.async_add_executor_job = AsyncMock(return_value={})
+            mock_get_instance.return_value = mock_recorder
+
+            await coordinator._async_update_data()
+            await coordinator._async_update_data()
+            assert mock_create_task.call_count == 1
+
+            # Finished without success: wait 24 hours before trying again
+            running_task.done.return_value = True
+            await coordinator._async_update_data()
+            assert mock_create_task.call_count == 1
+
+            coordinator._last_historical_attempt = dt_util.now() - timedelta(hours=25)
+            await coordinator._async_update_data()
+            assert mock_create_task.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_async_close_cancels_historical_fetch(
+        self, mock_scraper, hass, config_entry
+    ):
+        """Test unloading stops a running historical fetch before closing."""
+        coordinator = SFWaterCoordinator(hass, config_entry)
+        task = asyncio.get_running_loop().create_task(asyncio.Event().wait())
+        coordinator._historical_fetch_task = task
+
+        await coordinator.async_close()
+
+        assert task.cancelled()
+        assert coordinator._historical_fetch_task is None
+        mock_scraper.close.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_async_setup_restores_state(self, hass, config_entry):
+        """Test persisted fetch state is restored before the first refresh."""
+        coordinator = SFWaterCoordinator(hass, config_entry)
+        coordinator._store = Mock()
+        coordinator._store.async_load = AsyncMock(
+            return_value={
+                "historical_data_fetched": True,
+                "last_backfill": "2025-10-01T06:00:00+00:00",
+            }
+        )
+
+        await coordinator._async_setup()
+
+        assert coordinator._historical_data_fetched is True
+        assert coordinator._last_backfill_date == datetime(
+            2025, 10, 1, 6, 0, tzinfo=dt_util.UTC
+        )
+
+    @patch("custom_components.sfpuc.coordinator.SFPUCScraper")
+    @pytest.mark.asyncio
+    async def test_update_skips_historical_check_when_already_fetched(
+        self, mock_scraper_class, hass, config_entry
+    ):
+        """Test the recorder isn't queried for history once a fetch is stored."""
+        mock_scraper = Mock()
+        mock_scraper_class.return_value = mock_scraper
+        mock_scraper.is_authenticated = True
+
+        coordinator = SFWaterCoordinator(hass, config_entry)
+        coordinator._historical_data_fetched = True
+
+        with (
+            patch(
+                "homeassistant.components.recorder.get_instance"
+            ) as mock_get_instance,
+            patch(
+                "custom_components.sfpuc.coordinator.async_backfill_missing_data",
+                AsyncMock(),
+            ),
+            patch(
+                "custom_components.sfpuc.coordinator.async_check_has_historical_data",
+                AsyncMock(return_value=False),
+            ) as mock_check,
+            patch(
+                "custom_components.sfpuc.coordinator.async_detect_billing_day",
+                AsyncMock(),
+            ),
+        ):
+            mock_recorder = Mock()
+            mock_recorder.async_add_executor_job = AsyncMock(return_value={})
+            mock_get_instance.return_value = mock_recorder
+
+            await coordinator._async_update_data()
+
+        mock_check.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_async_save_state(self, hass, config_entry):
+        """Test the fetch state is persisted in a JSON-serializable form."""
+        coordinator = SFWaterCoordinator(hass, config_entry)
+        coordinator._store = Mock()
+        coordinator._store.async_save = AsyncMock()
+        coordinator._historical_data_fetched = True
+        coordinator._last_backfill_date = datetime(
+            2025, 10, 1, 6, 0, tzinfo=dt_util.UTC
+        )
+
+        await coordinator.async_save_state()
+
+        coordinator._store.async_save.assert_awaited_once_with(
+            {
+                "historical_data_fetched": True,
+                "last_backfill": "2025-10-01T06:00:00+00:00",
+            }
+        )
@@ -1,17 +1,52 @@
 """Tests for SFPUC data fetching operations."""
 
 from datetime import datetime, timedelta
+import logging
+import time
 from unittest.mock import AsyncMock, Mock, patch
 
+from homeassistant.util import dt as dt_util
 import pytest
+import requests
 
 from custom_components.sfpuc.coordinator import SFWaterCoordinator
 from custom_components.sfpuc.data_fetcher import (
+    _async_fetch_daily_chunk,
+    _async_fetch_with_retry,
+    _chunk_schedule,
+    _day_schedule,
     async_backfill_missing_data,
+    async_background_historical_fetch,
+    async_check_has_historical_data,
     async_fetch_historical_data,
 )
 
-from .common import MockConfigEntry
+
+def _usage_row(timestamp, usage, resolution):
+    """Build one usage point in the shape the scraper returns."""
+    return {"timestamp": timestamp, "usage": usage, "resolution": resolution}
+
+
+_MONTHLY = [_usage_row(datetime(2023, 9, 15), 150.0, "monthly")]
+_DAILY = [_usage_row(datetime(2023, 9, 25), 140.0, "daily")]
+_HOURLY = [_usage_row(datetime(2023, 9, 30, 15, 0), 25.0, "hourly")]
+
+
+def _by_resolution(fail_first=None, **rows):
+    """Build a get_usage_data side effect that answers per resolution.
+
+    The first request for the fail_first resolution raises a network error;
+    resolutions without rows get an empty export.
+    """
+    failed = []
+
+    def side_effect(start, end, resolution):
+        if resolution == fail_first and not failed:
+            failed.append(resolution)
+            raise requests.ConnectionError("Network error")
+        return rows.get(resolution, [])
+
+    return side_effect
 
 
 @pytest.fixture
@@ -27,8 +62,6 @@ class TestDataFetcher:
     @pytest.fixture(autouse=True)
     def setup_method(self, hass):
         """Set up test fixtures."""
-        self.hass = hass
-        self.config_entry = MockConfigEntry()
         # Add recorder instance to hass.data for statistics insertion
         from homeassistant.components.recorder.util import DATA_INSTANCE
 
@@ -50,30 +83,13 @@ class TestDataFetcher:
         ):
             yield
 
-    @patch("custom_components.sfpuc.coordinator.SFPUCScraper")
+    @pytest.mark.slow
     @pytest.mark.asyncio
     async def test_fetch_historical_data_success(
-        self, mock_scraper_class, hass, config_entry, mock_asyncio_sleep
+        self, mock_scraper, hass, config_entry, mock_asyncio_sleep
     ):
         """Test successful historical data fetching."""
-        mock_scraper = Mock()
-        mock_scraper_class.return_value = mock_scraper
-        mock_scraper.get_usage_data = Mock(
-            side_effect=[
-                # Monthly data
-                [
-                    {
-                        "timestamp": datetime(2023, 9, 15),
-                        "usage": 150.0,
-                        "resolution": "monthly",
-                    }
-                ],
-                # Daily data - empty to end loop
-                [],
-                # Hourly data - empty to end loop
-                [],
-            ]
-        )
+        mock_scraper.get_usage_data.side_effect = _by_resolution(monthly=_MONTHLY)
 
         coordinator = SFWaterCoordinator(hass, config_entry)
 
@@ -91,33 +107,96 @@ class TestDataFetcher:
 
         assert mock_insert_stats.call_count >= 1
 
-    @patch("custom_components.sfpuc.coordinator.SFPUCScraper")
-    @patch("custom_components.sfpuc.coordinator._LOGGER")
+    @pytest.mark.slow
     @pytest.mark.asyncio
     async def test_fetch_historical_data_failure(
-        self, mock_logger, mock_scraper_class, hass, config_entry, mock_asyncio_sleep
+        self, mock_scraper, hass, config_entry, mock_asyncio_sleep, caplog
     ):
         """Test historical data fetching with failures."""
-        mock_scraper = Mock()
-        mock_scraper_class.return_value = mock_scraper
         mock_scraper.get_usage_data.side_effect = Exception("Network error")
 
         coordinator = SFWaterCoordinator(hass, config_entry)
 
         # Should not raise exception, just log warning
-        await async_fetch_historical_data(coordinator)
+        with caplog.at_level(
+            logging.WARNING, logger="custom_components.sfpuc.coordinator"
+        ):
+            assert await async_fetch_historical_data(coordinator) == 0
+
+        # Verify a warning was logged
+        assert any(record.levelno == logging.WARNING for record in caplog.records)
+
+    @pytest.mark.slow
+    @pytest.mark.asyncio
+    async def test_fetch_historical_data_incomplete_daily_inserts_nothing(
+        self, mock_scraper, hass, config_entry, mock_asyncio_sleep
+    ):
+        """Test a daily chunk that keeps failing aborts the whole insert."""
+
+        def get_usage_data_side_effect(start, end, resolution):
+            if resolution == "daily":
+                raise requests.ConnectionError("Network error")
+            return {"monthly": _MONTHLY, "hourly": _HOURLY}[resolution]
+
+        mock_scraper.get_usage_data.side_effect = get_usage_data_side_effect
+
+        coordinator = SFWaterCoordinator(hass, config_entry)
 
-        # Verify logger was called
-        mock_logger.warning.assert_called()
+        with patch(
+            "custom_components.sfpuc.data_fetcher.async_insert_statistics",
+            new_callable=AsyncMock,
+        ) as mock_insert_stats:
+            assert await async_fetch_historical_data(coordinator) == 0
+
+        mock_insert_stats.assert_not_called()
+
+    @pytest.mark.slow
+    @pytest.mark.asyncio
+    async def test_background_fetch_without_data_is_not_recorded(
+        self, mock_scraper, hass, config_entry, mock_asyncio_sleep
+    ):
+        """Test a background fetch where every window fails is retried later."""
+        mock_scraper.get_usage_data.side_effect = Exception("Network error")
+
+        coordinator = SFWaterCoordinator(hass, config_entry)
+        coordinator.async_save_state = AsyncMock()
+
+        await async_background_historical_fetch(coordinator)
+
+        assert coordinator._historical_data_fetched is False
+        coordinator.async_save_state.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_check_has_historical_data_probes_one_month(
+        self, mock_scraper, hass, config_entry
+    ):
+        """Test the history check reads a single month from a year ago."""
+        coordinator = SFWaterCoordinator(hass, config_entry)
+
+        with patch(
+            "custom_components.sfpuc.data_fetcher.get_instance"
+        ) as mock_get_instance:
+            mock_recorder = Mock()
+            mock_recorder.async_add_executor_job = AsyncMock(
+                return_value={coordinator.stat_id: [{"sum": 1200.0}]}
+            )
+            mock_get_instance.return_value = mock_recorder
+
+            assert await async_check_has_historical_data(coordinator) is True
+
+            args = mock_recorder.async_add_executor_job.call_args.args
+            start_time, end_time, period = args[2], args[3], args[5]
+            assert end_time - start_time == timedelta(days=31)
+            assert period == "month"
+
+            mock_recorder.async_add_executor_job.return_value = {}
+            assert await async_check_has_historical_data(coordinator) is False
 
-    @patch("custom_components.sfpuc.coordinator.SFPUCScraper")
     @pytest.mark.asyncio
     async def test_backfill_missing_data_first_run(
-        self, mock_scraper_class, hass, config_entry, mock_asyncio_sleep
+        self, mock_scraper, hass, config_entry, mock_asyncio_sleep
     ):
         """Test backfilling is skipped when no data exists (first run)."""
-        mock_scraper = Mock()
-        mock_scraper_class.return_value = mock_scraper
         mock_scraper.get_usage_data.return_value = []
 
         coordinator = SFWaterCoordinator(hass, config_entry)
@@ -128,98 +207,50 @@ class TestDataFetcher:
         # Should have not raised an exception
         assert coordinator._last_backfill_date is None  # Was skipped
 
-    @patch("custom_components.sfpuc.coordinator.SFPUCScraper")
     @pytest.mark.asyncio
     async def test_backfill_missing_data_recent_run(
-        self, mock_scraper_class, hass, config_entry
+        self, mock_scraper, hass, config_entry
     ):
         """Test backfilling is skipped when recently run."""
-        mock_scraper = Mock()
-        mock_scraper_class.return_value = mock_scraper
 
         coordinator = SFWaterCoordinator(hass, config_entry)
         # Set last backfill to recent time
-        coordinator._last_backfill_date = datetime.now() - timedelta(hours=1)
+        coordinator._last_backfill_date = dt_util.now() - timedelta(hours=1)
 
         await async_backfill_missing_data(coordinator)
 
         # Should not perform backfill
         mock_scraper.get_usage_data.assert_not_called()
 
-    @patch("custom_components.sfpuc.coordinator.SFPUCScraper")
     @pytest.mark.asyncio
-    async def test_fetch_historical_data_daily_retry_on_failure(
-        self, mock_scraper_class, hass, config_entry, mock_asyncio_sleep
+    async def test_backfill_throttle_ignores_wall_clock_jumps(
+        self, mock_scraper, hass, config_entry
     ):
-        """Test retry logic for daily data fetching with transient failures."""
-        mock_scraper = Mock()
-        mock_scraper_class.return_value = mock_scraper
-
-        # First call fails, second succeeds (simulating transient failure)
-        mock_scraper.get_usage_data = Mock(
-            side_effect=[
-                # Monthly data
-                [
-                    {
-                        "timestamp": datetime(2023, 9, 15),
-                        "usage": 150.0,
-                        "resolution": "monthly",
-                    }
-                ],
-                # Daily data - 1st attempt fails, 2nd succeeds
-                Exception("Network error"),
-                [
-                    {
-                        "timestamp": datetime(2023, 9, 25),
-                        "usage": 140.0,
-                        "resolution": "daily",
-                    }
-                ],
-                # Hourly data - empty to end loop
-                [],
-            ]
-        )
+        """Test a backfill earlier in this run throttles by monotonic time."""
 
         coordinator = SFWaterCoordinator(hass, config_entry)
+        # Wall clock jumped forward a day since the last backfill
+        coordinator._last_backfill_date = dt_util.now() - timedelta(days=1)
+        coordinator._last_backfill_monotonic = time.monotonic()
 
-        with (
-            patch(
-                "custom_components.sfpuc.data_fetcher.async_check_has_historical_data",
-                return_value=False,
-            ),
-            patch(
-                "custom_components.sfpuc.data_fetcher.async_insert_statistics",
-                new_callable=AsyncMock,
-            ) as mock_insert_stats,
-        ):
-            await async_fetch_historical_data(coordinator)
+        with patch(
+            "custom_components.sfpuc.data_fetcher.get_instance"
+        ) as mock_get_instance:
+            await async_backfill_missing_data(coordinator)
+
+        mock_get_instance.assert_not_called()
+        mock_scraper.get_usage_data.assert_not_called()
+
+    @pytest.mark.slow
+    @pytest.mark.asyncio
+    async def test_fetch_historical_data_daily_retry_on_failure(
+        self, mock_scraper, hass, config_entry, mock_asyncio_sleep
+    ):
         """Test retry logic for daily data fetching with transient failures."""
-        mock_scraper = Mock()
-        mock_scraper_class.return_value = mock_scraper
-
-        # First call fails, second succeeds (simulating transient failure)
-        mock_scraper.get_usage_data = Mock(
-            side_effect=[
-                # Monthly data
-                [
-                    {
-                        "timestamp": datetime(2023, 9, 15),
-                        "usage": 150.0,
-                        "resolution": "monthly",
-                    }
-                ],
-                # Daily data - 1st attempt fails, 2nd succeeds
-                Exception("Network error"),
-                [
-                    {
-                        "timestamp": datetime(2023, 9, 25),
-                        "usage": 140.0,
-                        "resolution": "daily",
-                    }
-                ],
-                # Hourly data
-                [],
-            ]
+
+        # First daily call fails, its retry succeeds (transient failure)
+        mock_scraper.get_usage_data.side_effect = _by_resolution(
+            "daily", monthly=_MONTHLY, daily=_DAILY
         )
 
         coordinator = SFWaterCoordinator(hass, config_entry)
@@ -240,39 +271,16 @@ class TestDataFetcher:
         assert mock_insert_stats.call_count >= 1
         assert mock_scraper.get_usage_data.call_count >= 3
 
-    @patch("custom_components.sfpuc.coordinator.SFPUCScraper")
+    @pytest.mark.slow
     @pytest.mark.asyncio
     async def test_fetch_historical_data_hourly_retry_on_failure(
-        self, mock_scraper_class, hass, config_entry, mock_asyncio_sleep
+        self, mock_scraper, hass, config_entry, mock_asyncio_sleep
     ):
         """Test retry logic for hourly data fetching with transient failures."""
-        mock_scraper = Mock()
-        mock_scraper_class.return_value = mock_scraper
-
-        # Monthly and daily succeed, hourly fails then succeeds
-        mock_scraper.get_usage_data = Mock(
-            side_effect=[
-                # Monthly data
-                [
-                    {
-                        "timestamp": datetime(2023, 9, 15),
-                        "usage": 150.0,
-                        "resolution": "monthly",
-                    }
-                ],
-                # Daily data
-                [],
-                # Hourly data - 1st attempt fails
-                Exception("Timeout"),
-                # Hourly data - 2nd attempt succeeds
-                [
-                    {
-                        "timestamp": datetime(2023, 9, 30, 15, 0),
-                        "usage": 25.0,
-                        "resolution": "hourly",
-                    }
-                ],
-            ]
+
+        # Monthly and daily succeed, first hourly call fails then succeeds
+        mock_scraper.get_usage_data.side_effect = _by_resolution(
+            "hourly", monthly=_MONTHLY, hourly=_HOURLY
         )
 
         coordinator = SFWaterCoordinator(hass, config_entry)
@@ -292,14 +300,11 @@ class TestDataFetcher:
         # Should have retried hourly data
         assert mock_scraper.get_usage_data.call_count >= 3
 
-    @patch("custom_components.sfpuc.coordinator.SFPUCScraper")
     @pytest.mark.asyncio
     async def test_backfill_retry_on_failure(
-        self, mock_scraper_class, hass, config_entry, mock_asyncio_sleep
+        self, mock_scraper, hass, config_entry, mock_asyncio_sleep
     ):
         """Test backfill handles network errors gracefully."""
-        mock_scraper = Mock()
-        mock_scraper_class.return_value = mock_scraper
 
         # Simulate network failure
         mock_scraper.get_usage_data = Mock(side_effect=Exception("Network error"))
@@ -312,14 +317,11 @@ class TestDataFetcher:
         # Should have logged the failure but not raised
         assert True  # Test passed if no exception was raised
 
-    @patch("custom_components.sfpuc.coordinator.SFPUCScraper")
     @pytest.mark.asyncio
     async def test_backfill_handles_continued_failures(
-        self, mock_scraper_class, hass, config_entry, mock_asyncio_sleep
+        self, mock_scraper, hass, config_entry, mock_asyncio_sleep
     ):
         """Test backfill handles continued failures and doesn't raise."""
-        mock_scraper = Mock()
-        mock_scraper_class.return_value = mock_scraper
 
         # All calls fail
         mock_scraper.get_usage_data = Mock(side_effect=Exception("Data unavailable"))
@@ -332,10 +334,51 @@ class TestDataFetcher:
         # Should have logged failures but not raised
         assert True  # Test passed if no exception was raised
 
-    @patch("custom_components.sfpuc.coordinator.SFPUCScraper")
+    @pytest.mark.asyncio
+    async def test_backfill_fetches_missing_days_skipping_failures(
+        self, mock_scraper, hass, config_entry, mock_asyncio_sleep
+    ):
+        """Test backfill queues every missing day and keeps the ones that load."""
+
+        last_start = (dt_util.now() - timedelta(days=5)).replace(
+            hour=10, minute=0, second=0, microsecond=0
+        )
+
+        def get_usage_data_side_effect(start, end, resolution):
+            if start.date() == last_start.date():
+                raise Exception("Network error")
+            return [_usage_row(start, 1.0, resolution)]
+
+        mock_scraper.get_usage_data = Mock(side_effect=get_usage_data_side_effect)
+
+        coordinator = SFWaterCoordinator(hass, config_entry)
+
+        with (
+            patch(
+                "custom_components.sfpuc.data_fetcher.get_instance"
+            ) as mock_get_instance,
+            patch(
+                "custom_components.sfpuc.data_fetcher.async_insert_statistics",
+                new_callable=AsyncMock,
+            ) as mock_insert_stats,
+        ):
+            mock_recorder = Mock()
+            mock_recorder.async_add_executor_job = AsyncMock(
+                return_value={coordinator.stat_id: [{"start": last_start.timestamp()}]}
+            )
+            mock_get_instance.return_value = mock_recorder
+
+            await async_backfill_missing_data(coordinator)
+
+        # Four days from the last statistic through the 2-day lag; one failed
+        inserted = mock_insert_stats.call_args.args[1]
+        assert len(inserted) == 3
+        assert coordinator._last_backfill_date is not None
+
+    @pytest.mark.slow
     @pytest.mark.asyncio
     async def test_fetch_historical_data_no_gap_daily_to_hourly(
-        self, mock_scraper_class, hass, config_entry, mock_asyncio_sleep
+        self, mock_scraper, hass, config_entry, mock_asyncio_sleep
     ):
         """Test that daily and hourly data transition has no gaps.
 
@@ -343,55 +386,31 @@ class TestDataFetcher:
         boundary mismatch between daily (ends 31 days ago) and hourly
         (started 31 days ago from 'now' instead of from 'end_date_available').
 
-        Daily data ends 31 days ago from end_date_available (which is 2 days back).
-        Hourly data starts 32 days ago from 'now', creating 1-day overlap.
+        Daily data ends 31 days before end_date_available (33 days back).
+        Hourly data starts 32 days back, the very next day, so the windows
+        meet without a gap and without sharing a day.
         """
-        mock_scraper = Mock()
-        mock_scraper_class.return_value = mock_scraper
 
         # Create realistic data points around the boundary
         # This simulates the transition from daily to hourly data
-        now = datetime.now()
+        # The hass fixture runs in San Francisco time, like the portal
+        now = dt_util.now().replace(tzinfo=None)
         end_date_available = now - timedelta(days=2)  # SFPUC 2-day lag
         daily_end = end_date_available - timedelta(days=31)  # 31 days back
         hourly_start = now - timedelta(days=32)  # 32 days back
 
         # Data points spanning the boundary
         daily_data = [
-            {
-                "timestamp": daily_end - timedelta(days=2),
-                "usage": 80.0,
-                "resolution": "daily",
-            },
-            {
-                "timestamp": daily_end - timedelta(days=1),
-                "usage": 85.0,
-                "resolution": "daily",
-            },
-            {
-                "timestamp": daily_end,
-                "usage": 90.0,
-                "resolution": "daily",
-            },
+            _usage_row(daily_end - timedelta(days=2), 80.0, "daily"),
+            _usage_row(daily_end - timedelta(days=1), 85.0, "daily"),
+            _usage_row(daily_end, 90.0, "daily"),
         ]
 
-        # Hourly data starting from 32 days ago (1 day overlap with daily)
+        # Hourly data starting from 32 days ago, the day after daily ends
         hourly_data = [
-            {
-                "timestamp": hourly_start,
-                "usage": 3.75,
-                "resolution": "hourly",
-            },
-            {
-                "timestamp": hourly_start + timedelta(hours=1),
-                "usage": 3.80,
-                "resolution": "hourly",
-            },
-            {
-                "timestamp": hourly_start + timedelta(days=1),
-                "usage": 3.85,
-                "resolution": "hourly",
-            },
+            _usage_row(hourly_start, 3.75, "hourly"),
+            _usage_row(hourly_start + timedelta(hours=1), 3.80, "hourly"),
+            _usage_row(hourly_start + timedelta(days=1), 3.85, "hourly"),
         ]
 
         # Mock the scraper to return data in expected fetch order
@@ -427,25 +446,25 @@ class TestDataFetcher:
             await async_fetch_historical_data(coordinator)
 
         # Verify both daily and hourly data were inserted
-        assert mock_insert_stats.call_count >= 2
+        inserted = mock_insert_stats.call_args.args[1]
+        resolutions = {point["resolution"] for point in inserted}
+        assert {"daily", "hourly"} <= resolutions
 
         # Verify that calls were made for all three resolutions
         # monthly=1, daily chunks (at least 1), hourly days (at least 1)
         assert mock_scraper.get_usage_data.call_count >= 3
 
-    @patch("custom_components.sfpuc.coordinator.SFPUCScraper")
+    @pytest.mark.slow
     @pytest.mark.asyncio
     async def test_fetch_historical_data_hourly_includes_day_32_back(
-        self, mock_scraper_class, hass, config_entry, mock_asyncio_sleep
+        self, mock_scraper, hass, config_entry, mock_asyncio_sleep
     ):
-        """Test that hourly data fetch loop includes day 32 back for overlap.
+        """Test that the hourly window starts 32 days back.
 
-        The hourly data loop should use range(32, 1, -1) to ensure it starts
-        32 days back from today, which creates overlap with daily data ending
-        31 days back from end_date_available.
+        The hourly day schedule runs from 32 to 2 days back from today, so it
+        starts the day after the daily window ends (31 days before
+        end_date_available).
         """
-        mock_scraper = Mock()
-        mock_scraper_class.return_value = mock_scraper
 
         # Collect all the dates that hourly data is requested for
         hourly_dates_requested = []
@@ -479,8 +498,193 @@ class TestDataFetcher:
             min(start, end) for start, end in hourly_dates_requested
         )
 
-        now = datetime.now()
-        expected_earliest = (now - timedelta(days=32)).date()
+        expected_earliest = (dt_util.now() - timedelta(days=32)).date()
 
-        # The hourly data should start from 32 days back to overlap with daily
+        # The hourly data should start 32 days back, right after daily ends
         assert earliest_hourly_date == expected_earliest
+
+    @pytest.mark.slow
+    @pytest.mark.asyncio
+    async def test_fetch_historical_data_windows_disjoint(
+        self, mock_scraper, hass, config_entry, mock_asyncio_sleep
+    ):
+        """Test monthly, daily and hourly windows never cover the same days."""
+
+        requested = {"monthly": [], "daily": [], "hourly": []}
+
+        def get_usage_data_side_effect(start, end, resolution):
+            requested[resolution].append((start.date(), end.date()))
+            return []
+
+        mock_scraper.get_usage_data = Mock(side_effect=get_usage_data_side_effect)
+
+        coordinator = SFWaterCoordinator(hass, config_entry)
+
+        with patch(
+            "custom_components.sfpuc.data_fetcher.async_insert_statistics",
+            new_callable=AsyncMock,
+        ):
+            await async_fetch_historical_data(coordinator)
+
+        assert len(requested["monthly"]) == 1
+        monthly_end = requested["monthly"][0][1]
+        daily_start = min(start for start, _ in requested["daily"])
+        daily_end = max(end for _, end in requested["daily"])
+        hourly_start = min(start for start, _ in requested["hourly"])
+
+        assert daily_start.day == 1
+        assert monthly_end < daily_start
+        assert daily_end < hourly_start
+
+    @pytest.mark.slow
+    @pytest.mark.asyncio
+    async def test_fetch_historical_data_inserts_oldest_first(
+        self, mock_scraper, hass, config_entry, mock_asyncio_sleep
+    ):
+        """Test concurrently fetched windows are inserted once, oldest first."""
+
+        def get_usage_data_side_effect(start, end, resolution):
+            return [_usage_row(start, 1.0, resolution)]
+
+        mock_scraper.get_usage_data = Mock(side_effect=get_usage_data_side_effect)
+
+        coordinator = SFWaterCoordinator(hass, config_entry)
+
+        with patch(
+            "custom_components.sfpuc.data_fetcher.async_insert_statistics",
+            new_callable=AsyncMock,
+        ) as mock_insert_stats:
+            await async_fetch_historical_data(coordinator)
+
+        mock_insert_stats.assert_awaited_once()
+        inserted = [
+            point["resolution"] for point in mock_insert_stats.call_args.args[1]
+        ]
+        assert inserted == sorted(inserted, key=["monthly", "daily", "hourly"].index)
+        assert set(inserted) == {"monthly", "daily", "hourly"}
+
+    @pytest.mark.asyncio
+    async def test_daily_chunk_halves_rejected_ranges(
+        self, mock_scraper, hass, config_entry, mock_asyncio_sleep
+    ):
+        """Test a range the portal won't export is split until it loads."""
+
+        def get_usage_data_side_effect(start, end, resolution):
+            if (end - start).days > 2:
+                return None
+            return [
+                {"timestamp": start + timedelta(days=offset), "usage": 1.0}
+                for offset in range((end - start).days + 1)
+            ]
+
+        mock_scraper.get_usage_data = Mock(side_effect=get_usage_data_side_effect)
+        mock_scraper.is_authenticated = True
+
+        coordinator = SFWaterCoordinator(hass, config_entry)
+        data = await _async_fetch_daily_chunk(
+            coordinator, datetime(2023, 7, 1), datetime(2023, 7, 7)
+        )
+
+        assert [point["timestamp"].day for point in data] == list(range(1, 8))
+        requested = [
+            (call.args[0].day, call.args[1].day)
+            for call in mock_scraper.get_usage_data.call_args_list
+        ]
+        assert requested == [(1, 7), (1, 4), (1, 2), (3, 4), (5, 7)]
+
+    @pytest.mark.asyncio
+    async def test_daily_chunk_does_not_split_after_failed_login(
+        self, mock_scraper, hass, config_entry, mock_asyncio_sleep
+    ):
+        """Test a chunk is not halved when the session can't be restored."""
+        mock_scraper.get_usage_data.return_value = None
+        mock_scraper.is_authenticated = False
+        mock_scraper.login.return_value = False
+
+        coordinator = SFWaterCoordinator(hass, config_entry)
+        data = await _async_fetch_daily_chunk(
+            coordinator, datetime(2023, 7, 1), datetime(2023, 7, 7)
+        )
+
+        assert data is None
+        mock_scraper.get_usage_data.assert_called_once()
+        mock_scraper.login.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_daily_chunk_does_not_split_network_errors(
+        self, mock_scraper, hass, config_entry, mock_asyncio_sleep
+    ):
+        """Test a chunk that can't reach the portal is retried whole, not halved."""
+        mock_scraper.get_usage_data.side_effect = requests.ConnectionError("Refused")
+        mock_scraper.is_authenticated = True
+
+        coordinator = SFWaterCoordinator(hass, config_entry)
+        with pytest.raises(requests.ConnectionError):
+            await _async_fetch_daily_chunk(
+                coordinator, datetime(2023, 7, 1), datetime(2023, 7, 7)
+            )
+
+        requested = [
+            (call.args[0].day, call.args[1].day)
+            for call in mock_scraper.get_usage_data.call_args_list
+        ]
+        assert requested == [(1, 7)] * 3
+
+    @pytest.mark.asyncio
+    async def test_fetch_with_retry_jitters_backoff(
+        self, mock_scraper, hass, config_entry, mock_asyncio_sleep
+    ):
+        """Test scraper network errors are retried with jittered backoff."""
+        mock_scraper.get_usage_data.side_effect = [
+            requests.ConnectionError("Connection reset"),
+            requests.Timeout("Read timed out"),
+            [],
+        ]
+        mock_scraper.is_authenticated = True
+
+        coordinator = SFWaterCoordinator(hass, config_entry)
+        with patch("custom_components.sfpuc.coordinator.MIN_REQUEST_INTERVAL", 0):
+            result = await _async_fetch_with_retry(
+                coordinator, datetime(2023, 7, 1), datetime(2023, 7, 1), "hourly"
+            )
+
+        assert result == []
+        assert mock_scraper.get_usage_data.call_count == 3
+        first, second = (call.args[0] for call in mock_asyncio_sleep.await_args_list)
+        assert 0.5 <= first <= 1.5
+        assert 1.0 <= second <= 3.0
+
+    @pytest.mark.asyncio
+    async def test_fetch_with_retry_does_not_repeat_refused_ranges(
+        self, mock_scraper, hass, config_entry, mock_asyncio_sleep
+    ):
+        """Test a range the portal answered without an export is asked once."""
+        mock_scraper.get_usage_data.return_value = None
+        mock_scraper.is_authenticated = True
+
+        coordinator = SFWaterCoordinator(hass, config_entry)
+        result = await _async_fetch_with_retry(
+            coordinator, datetime(2023, 7, 1), datetime(2023, 7, 7), "daily"
+        )
+
+        assert result is None
+        mock_scraper.get_usage_data.assert_called_once()
+
+    def test_schedules_cover_each_day_once(self):
+        """Test chunk and day schedules are contiguous without overlap."""
+        start = datetime(2023, 7, 1)
+        end = datetime(2023, 7, 10)
+
+        assert _chunk_schedule(start, end, 4) == [
+            (datetime(2023, 7, 1), datetime(2023, 7, 4)),
+            (datetime(2023, 7, 5), datetime(2023, 7, 8)),
+            (datetime(2023, 7, 9), datetime(2023, 7, 10)),
+        ]
+
+        days = _day_schedule(datetime(2023, 7, 1, 14), datetime(2023, 7, 3, 9))
+        assert days == [
+            datetime(2023, 7, 1, 14),
+            datetime(2023, 7, 2, 14),
+            datetime(2023, 7, 3, 14),
+        ]
+        assert _day_schedule(end, start) == []
@@ -61,6 +61,7 @@ class TestSFWaterIntegration:
         """Test successful integration unload."""
         # Mock the config entry runtime data
         mock_coordinator = Mock()
+        mock_coordinator.async_close = AsyncMock()
         config_entry.runtime_data = mock_coordinator
 
         # Mock the platform unloading
@@ -72,6 +73,8 @@ class TestSFWaterIntegration:
 
             assert result is True
             mock_unload.assert_called_once_with(config_entry, ["sensor"])
+            # Scraper session should be closed
+            mock_coordinator.async_close.assert_awaited_once()
 
     async def test_async_unload_entry_no_coordinator(self, hass, config_entry):
         """Test unload when no coordinator is present."""
@@ -93,6 +96,7 @@ class TestSFWaterIntegration:
         """Test unload when coordinator unload fails."""
         # Mock the config entry runtime data
         mock_coordinator = Mock()
+        mock_coordinator.async_close = AsyncMock()
         config_entry.runtime_data = mock_coordinator
 
         # Mock the platform unloading to fail
@@ -104,3 +108,5 @@ class TestSFWaterIntegration:
 
             assert result is False
             mock_unload.assert_called_once_with(config_entry, ["sensor"])
+            # Session stays open while the entry is still loaded
+            mock_coordinator.async_close.assert_not_awaited()
@@ -3,7 +3,14 @@
 from datetime import datetime
 from unittest.mock import Mock, patch
 
+import pytest
+import requests
+
 from custom_components.sfpuc.coordinator import SFPUCScraper
+from custom_components.sfpuc.scraper import (
+    _extract_form_inputs,
+    _parse_hourly_timestamp,
+)
 
 
 class TestSFPUCScraper:
@@ -36,11 +43,12 @@ class TestSFPUCScraper:
         login_response = Mock()
         login_response.status_code = 200
         login_response.url = "https://myaccount-water.sfpuc.org/MY_ACCOUNT_RSF.aspx"
-        login_response.text = "Welcome to your account"
+        login_response.content = b"Welcome to your account"
         mock_post.return_value = login_response
 
         result = self.scraper.login()
         assert result is True
+        assert self.scraper.is_authenticated is True
 
         # Verify login was called with correct data
         mock_post.assert_called_once()
@@ -48,6 +56,88 @@ class TestSFPUCScraper:
         assert call_args[1]["data"]["tb_USER_ID"] == self.username
         assert call_args[1]["data"]["tb_USER_PSWD"] == self.password
 
+    def test_extract_form_inputs_regex(self):
+        """Test form tokens are extracted and unescaped without a DOM."""
+        content = b"""
+        <input type="hidden" name="__VIEWSTATE" id="__VIEWSTATE" value="a+b/c=" />
+        <INPUT data-name="ignored" name="__EVENTVALIDATION" value="x&amp;y">
+        <input type="submit" name="btn_SUBMIT" />
+        <input type="text" value="no name" />
+        """
+
+        assert _extract_form_inputs(content) == {
+            "__VIEWSTATE": "a+b/c=",
+            "__EVENTVALIDATION": "x&y",
+            "btn_SUBMIT": "",
+        }
+
+    def test_extract_form_inputs_falls_back_to_parser(self):
+        """Test markup the regexes don't match is still parsed."""
+        content = b"<input name='__VIEWSTATE' value='single_quoted'>"
+
+        assert _extract_form_inputs(content) == {"__VIEWSTATE": "single_quoted"}
+
+    @patch("requests.Session.get")
+    @patch("requests.Session.post")
+    def test_login_success_from_page_content(self, mock_post, mock_get):
+        """Test login falls back to page indicators when not redirected."""
+        login_page = Mock()
+        login_page.content = (
+            b'<input name="__VIEWSTATE" value="vs" />'
+            b'<input name="__EVENTVALIDATION" value="ev" />'
+        )
+        mock_get.return_value = login_page
+
+        login_response = Mock()
+        login_response.status_code = 200
+        login_response.url = "https://myaccount-water.sfpuc.org/HOME.aspx"
+        login_response.content = b"Welcome back - Logout"
+        mock_post.return_value = login_response
+
+        assert self.scraper.login() is True
+        assert self.scraper.is_authenticated is True
+
+    @patch("requests.Session.get")
+    @patch("requests.Session.post")
+    def test_login_reuses_unmodified_login_page(self, mock_post, mock_get):
+        """Test a 304 on the login page reuses the cached form tokens."""
+        login_page = Mock()
+        login_page.status_code = 200
+        login_page.headers = {"Last-Modified": "Mon, 02 Oct 2023 08:00:00 GMT"}
+        login_page.content = (
+            b'<input name="__VIEWSTATE" value="vs" />'
+            b'<input name="__EVENTVALIDATION" value="ev" />'
+        )
+        not_modified = Mock()
+        not_modified.status_code = 304
+        mock_get.side_effect = [login_page, not_modified]
+
+        login_response = Mock()
+        login_response.status_code = 200
+        login_response.url = "https://myaccount-water.sfpuc.org/MY_ACCOUNT_RSF.aspx"
+        mock_post.return_value = login_response
+
+        assert self.scraper.login() is True
+        assert self.scraper.login() is True
+
+        assert mock_get.call_args_list[1][1]["headers"] == {
+            "If-Modified-Since": "Mon, 02 Oct 2023 08:00:00 GMT"
+        }
+        assert mock_post.call_args[1]["data"]["__VIEWSTATE"] == "vs"
+
+    def test_parse_hourly_timestamp_labels(self):
+        """Test hour labels map onto the 24-hour clock of the requested day."""
+        day = datetime(2023, 10, 1)
+
+        assert _parse_hourly_timestamp("12 AM", day, day) == datetime(2023, 10, 1, 0)
+        assert _parse_hourly_timestamp("1 am", day, day) == datetime(2023, 10, 1, 1)
+        assert _parse_hourly_timestamp("12 PM", day, day) == datetime(2023, 10, 1, 12)
+        assert _parse_hourly_timestamp("11 PM", day, day) == datetime(2023, 10, 1, 23)
+        with pytest.raises(ValueError):
+            _parse_hourly_timestamp("Total", day, day)
+        with pytest.raises(KeyError):
+            _parse_hourly_timestamp("13 PM", day, day)
+
     @patch("requests.Session.get")
     def test_login_failure_no_form(self, mock_get):
         """Test login failure when form is not found."""
@@ -77,7 +167,7 @@ class TestSFPUCScraper:
         # Mock the login POST response (redirected back to login)
         login_response = Mock()
         login_response.url = "https://myaccount-water.sfpuc.org/"
-        login_response.text = "Invalid credentials"
+        login_response.content = b"Invalid credentials"
         mock_post.return_value = login_response
 
         result = self.scraper.login()
@@ -104,7 +194,9 @@ class TestSFPUCScraper:
         download_response.url = (
             "https://myaccount-water.sfpuc.org/TRANSACTIONS_EXCEL_DOWNLOAD.aspx"
         )
-        download_response.content = b"Date\tUsage\n7 AM\t50.5\n8 AM\t45.2\n"
+        download_response.iter_lines.return_value = (
+            b"Date\tUsage\n7 AM\t50.5\n8 AM\t45.2\n".splitlines()
+        )
         mock_post.return_value = download_response
 
         start_date = datetime(2023, 10, 1)
@@ -112,6 +204,10 @@ class TestSFPUCScraper:
 
         result = self.scraper.get_usage_data(start_date, end_date, "hourly")
 
+        # The export is streamed and its connection released afterwards
+        assert mock_post.call_args[1]["stream"] is True
+        download_response.close.assert_called_once()
+
         assert result is not None
         assert len(result) == 2
         # Should use the requested end_date for timestamps
@@ -146,7 +242,9 @@ class TestSFPUCScraper:
         download_response.url = (
             "https://myaccount-water.sfpuc.org/TRANSACTIONS_EXCEL_DOWNLOAD.aspx"
         )
-        download_response.content = b"Date\tUsage\n10/01\t150.5\n10/02\t145.2\n"
+        download_response.iter_lines.return_value = (
+            b"Date\tUsage\n10/01\t150.5\n10/02\t145.2\n".splitlines()
+        )
         mock_post.return_value = download_response
 
         start_date = datetime(2023, 10, 1)
@@ -183,7 +281,9 @@ class TestSFPUCScraper:
         download_response.url = (
             "https://myaccount-water.sfpuc.org/TRANSACTIONS_EXCEL_DOWNLOAD.aspx"
         )
-        download_response.content = b"Date\tUsage\nOct 23\t4500.5\nNov 23\t4200.2\n"
+        download_response.iter_lines.return_value = (
+            b"Date\tUsage\nOct 23\t4500.5\nNov 23\t4200.2\n".splitlines()
+        )
         mock_post.return_value = download_response
 
         start_date = datetime(2023, 10, 1)
@@ -225,6 +325,39 @@ class TestSFPUCScraper:
 
         assert result is None
 
+    @patch("requests.Session.get")
+    def test_get_usage_data_network_error_raises(self, mock_get):
+        """Test network errors are raised rather than reported as no export."""
+        mock_get.side_effect = requests.ConnectionError("Connection refused")
+
+        with pytest.raises(requests.ConnectionError):
+            self.scraper.get_usage_data(datetime(2023, 10, 1), None, "daily")
+
+    @patch("requests.Session.get")
+    @patch("requests.Session.post")
+    def test_get_usage_data_session_expired(self, mock_post, mock_get):
+        """Test usage data retrieval when the portal shows the sign-in form."""
+        self.scraper.is_authenticated = True
+
+        # Usage page request bounced back to the login page
+        login_page = Mock()
+        login_page.content = b"""
+        <html>
+            <form>
+                <input name="__VIEWSTATE" value="test_viewstate" />
+                <input name="tb_USER_ID" value="" />
+            </form>
+        </html>
+        """
+        mock_get.return_value = login_page
+
+        start_date = datetime(2023, 10, 1)
+        result = self.scraper.get_usage_data(start_date, None, "daily")
+
+        assert result is None
+        assert self.scraper.is_authenticated is False
+        mock_post.assert_not_called()
+
     def test_get_usage_data_invalid_resolution(self):
         """Test usage data retrieval with invalid resolution."""
         start_date = datetime(2023, 10, 1)
@@ -252,7 +385,9 @@ class TestSFPUCScraper:
         download_response.url = (
             "https://myaccount-water.sfpuc.org/TRANSACTIONS_EXCEL_DOWNLOAD.aspx"
         )
-        download_response.content = b"Date\tUsage\ninvalid_date\tinvalid_usage\n"
+        download_response.iter_lines.return_value = (
+            b"Date\tUsage\ninvalid_date\tinvalid_usage\n".splitlines()
+        )
         mock_post.return_value = download_response
 
         start_date = datetime(2023, 10, 1)
@@ -261,6 +396,63 @@ class TestSFPUCScraper:
         # Should return empty list since parsing failed
         assert result == []
 
+    def test_session_retries_transient_errors(self):
+        """Test the session adapter retries transient server errors."""
+        adapter = self.scraper.session.get_adapter(self.scraper.base_url)
+
+        assert adapter.max_retries.total == 3
+        assert 503 in adapter.max_retries.status_forcelist
+        assert 429 in adapter.max_retries.status_forcelist
+        assert adapter.max_retries.allowed_methods == frozenset(["GET"])
+        assert adapter.max_retries.respect_retry_after_header is False
+
+    def test_idle_session_is_not_authenticated(self):
+        """Test a session idle past the ASP.NET timeout counts as logged out."""
+        with patch("custom_components.sfpuc.scraper.time.monotonic") as mock_time:
+            mock_time.return_value = 1000.0
+            self.scraper.is_authenticated = True
+            assert self.scraper.is_authenticated is True
+
+            mock_time.return_value = 1000.0 + 19 * 60
+            assert self.scraper.is_authenticated is True
+
+            mock_time.return_value = 1000.0 + 21 * 60
+            assert self.scraper.is_authenticated is False
+
+    def test_close_closes_session(self):
+        """Test closing the scraper closes its HTTP session."""
+        with patch.object(self.scraper.session, "close") as mock_close:
+            self.scraper.close()
+
+        mock_close.assert_called_once()
+
+    @patch("requests.Session.get")
+    @patch("requests.Session.post")
+    def test_get_usage_data_skips_blank_and_short_rows(self, mock_post, mock_get):
+        """Test blank, short and partially empty rows are ignored."""
+        usage_page = Mock()
+        usage_page.content = b'<html><form><input name="token1" value="v" /></form>'
+        mock_get.return_value = usage_page
+
+        download_response = Mock()
+        download_response.url = (
+            "https://myaccount-water.sfpuc.org/TRANSACTIONS_EXCEL_DOWNLOAD.aspx"
+        )
+        download_response.iter_lines.return_value = (
+            b"Date\tUsage\r\n10/01\t150.5\r\n\r\n10/02\r\n\t12\r\n10/03\t99\r\n"
+        ).splitlines()
+        mock_post.return_value = download_response
+
+        start_date = datetime(2023, 10, 1)
+        end_date = datetime(2023, 10, 3)
+        result = self.scraper.get_usage_data(start_date, end_date, "daily")
+
+        assert [item["timestamp"] for item in result] == [
+            datetime(2023, 10, 1),
+            datetime(2023, 10, 3),
+        ]
+        assert [item["usage"] for item in result] == [150.5, 99.0]
+
     def test_get_daily_usage_legacy(self):
         """Test the legacy get_daily_usage method."""
         with patch.object(self.scraper, "get_usage_data") as mock_get_data:
@@ -293,7 +485,9 @@ class TestSFPUCScraper:
         download_response.url = (
             "https://myaccount-water.sfpuc.org/TRANSACTIONS_EXCEL_DOWNLOAD.aspx"
         )
-        download_response.content = b"Date\tUsage\n8/11\t97\n8/12\t112\n"
+        download_response.iter_lines.return_value = (
+            b"Date\tUsage\n8/11\t97\n8/12\t112\n".splitlines()
+        )
         mock_post.return_value = download_response
 
         start_date = datetime(2025, 8, 11)
@@ -331,9 +525,9 @@ class TestSFPUCScraper:
         download_response.url = (
             "https://myaccount-water.sfpuc.org/TRANSACTIONS_EXCEL_DOWNLOAD.aspx"
         )
-        download_response.content = (
+        download_response.iter_lines.return_value = (
             b"Date\tUsage\n7 AM\t7.48\n8 AM\t14.96\n12 PM\t0\n1 PM\t0\n"
-        )
+        ).splitlines()
         mock_post.return_value = download_response
 
         start_date = datetime(2025, 11, 9)
@@ -383,9 +577,9 @@ class TestSFPUCScraper:
         download_response.url = (
             "https://myaccount-water.sfpuc.org/TRANSACTIONS_EXCEL_DOWNLOAD.aspx"
         )
-        download_response.content = (
+        download_response.iter_lines.return_value = (
             b"Date\tConsumption in GALLONS\nMay 25\t2812\nJun 25\t2738\n"
-        )
+        ).splitlines()
         mock_post.return_value = download_response
 
         start_date = datetime(2025, 5, 1)
@@ -401,3 +595,32 @@ class TestSFPUCScraper:
         assert result[0]["resolution"] == "monthly"
         assert result[1]["timestamp"] == datetime(2025, 6, 1)
         assert result[1]["usage"] == 2738
+
+    @patch("requests.Session.get")
+    @patch("requests.Session.post")
+    def test_get_usage_data_monthly_unknown_month_skipped(self, mock_post, mock_get):
+        """Test monthly rows with an unrecognized month name are skipped."""
+        usage_page = Mock()
+        usage_page.content = b'<input name="token1" value="value1" />'
+        mock_get.return_value = usage_page
+
+        download_response = Mock()
+        download_response.url = (
+            "https://myaccount-water.sfpuc.org/TRANSACTIONS_EXCEL_DOWNLOAD.aspx"
+        )
+        download_response.iter_lines.return_value = (
+            b"Date\tConsumption in GALLONS\nFoo 25\t100\nsep 25\t2650\n"
+        ).splitlines()
+        mock_post.return_value = download_response
+
+        result = self.scraper.get_usage_data(
+            datetime(2025, 8, 1), datetime(2025, 9, 30), "monthly"
+        )
+
+        assert result == [
+            {
+                "timestamp": datetime(2025, 9, 1),
+                "usage": 2650.0,
+                "resolution": "monthly",
+            }
+        ]
@@ -1,62 +1,70 @@
 """Tests for San Francisco Water Power Sewer sensors."""
 
-from unittest.mock import Mock
+from dataclasses import dataclass
+from typing import Any
 
 from homeassistant.components.sensor import SensorDeviceClass
 from homeassistant.const import UnitOfVolume
-from homeassistant.core import HomeAssistant
 from homeassistant.helpers.device_registry import DeviceEntryType
+import pytest
 
-from custom_components.sfpuc.coordinator import SFWaterCoordinator
 from custom_components.sfpuc.sensor import WATER_SENSORS, SFWaterSensor
 
 from .common import MockConfigEntry
 
 
+@dataclass
+class _CoordinatorStub:
+    """The coordinator attributes the sensor reads."""
+
+    config_entry: MockConfigEntry
+    data: dict[str, Any]
+
+
+@pytest.fixture(scope="module")
+def daily_sensor():
+    """Build the current bill usage sensor once for the whole module."""
+    return SFWaterSensor(_CoordinatorStub(MockConfigEntry(), {}), WATER_SENSORS[0])
+
+
+@pytest.fixture(autouse=True)
+def reset_coordinator_data(daily_sensor):
+    """Give each test fresh coordinator data and clear it afterwards."""
+    daily_sensor.coordinator.data = {
+        "current_bill_usage": 150.5,
+        "last_updated": "2023-10-01T12:00:00Z",
+    }
+    yield
+    daily_sensor.coordinator.data = {}
+
+
 class TestSFWaterSensor:
     """Test the San Francisco Water Power Sewer sensor functionality."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.hass = Mock(spec=HomeAssistant)
-        self.config_entry = MockConfigEntry()
-        self.coordinator = Mock(spec=SFWaterCoordinator)
-        self.coordinator.config_entry = self.config_entry
-        self.coordinator.data = {
-            "current_bill_usage": 150.5,
-            "last_updated": "2023-10-01T12:00:00Z",
-        }
-
-    def test_sensor_initialization(self):
+    def test_sensor_initialization(self, daily_sensor):
         """Test sensor initialization."""
-        description = WATER_SENSORS[0]  # Daily usage sensor
-        sensor = SFWaterSensor(self.coordinator, description)
+        config_entry = daily_sensor.coordinator.config_entry
 
-        assert sensor.coordinator == self.coordinator
-        assert sensor.entity_description == description
+        assert daily_sensor.entity_description == WATER_SENSORS[0]
         assert (
-            sensor._attr_unique_id
+            daily_sensor._attr_unique_id
             == "water_account_test@example.com_current_bill_water_usage_to_date"
         )
-        assert sensor._attr_device_info["entry_type"] == DeviceEntryType.SERVICE
-        assert sensor._attr_device_info["identifiers"] == {
-            ("sfpuc", self.config_entry.entry_id)
-        }
-        assert sensor._attr_device_info["manufacturer"] == "SFPUC"
-        assert sensor._attr_device_info["model"] == "Water Usage"
-        assert sensor._attr_device_info["name"] == "San Francisco Water Power Sewer"
-
-    def test_daily_usage_sensor_properties(self):
+        device_info = daily_sensor._attr_device_info
+        assert device_info["entry_type"] == DeviceEntryType.SERVICE
+        assert device_info["identifiers"] == {("sfpuc", config_entry.entry_id)}
+        assert device_info["manufacturer"] == "SFPUC"
+        assert device_info["model"] == "Water Usage"
+        assert device_info["name"] == "San Francisco Water Power Sewer"
+
+    def test_daily_usage_sensor_properties(self, daily_sensor):
         """Test daily usage sensor properties."""
-        description = WATER_SENSORS[0]  # Daily usage sensor
-        sensor = SFWaterSensor(self.coordinator, description)
-
-        assert sensor.device_class == SensorDeviceClass.WATER
-        assert sensor.native_unit_of_measurement == UnitOfVolume.GALLONS
+        assert daily_sensor.device_class == SensorDeviceClass.WATER
+        assert daily_sensor.native_unit_of_measurement == UnitOfVolume.GALLONS
         assert (
-            sensor.state_class is None
+            daily_sensor.state_class is None
         )  # No state_class to prevent duplicate statistics
-        assert sensor.suggested_display_precision == 1
+        assert daily_sensor.suggested_display_precision == 1
 
     def test_hourly_usage_sensor_properties(self):
         """Test hourly usage sensor properties."""
@@ -68,12 +76,9 @@ class TestSFWaterSensor:
         # This sensor is no longer implemented
         pass
 
-    def test_daily_usage_sensor_value(self):
+    def test_daily_usage_sensor_value(self, daily_sensor):
         """Test daily usage sensor value."""
-        description = WATER_SENSORS[0]  # Daily usage sensor
-        sensor = SFWaterSensor(self.coordinator, description)
-
-        assert sensor.native_value == 150.5
+        assert daily_sensor.native_value == 150.5
 
     def test_hourly_usage_sensor_value(self):
         """Test hourly usage sensor value."""
@@ -85,24 +90,14 @@ class TestSFWaterSensor:
         # This sensor is no longer implemented
         pass
 
-    def test_sensor_value_with_missing_data(self):
+    def test_sensor_value_with_missing_data(self, daily_sensor):
         """Test sensor value when data is missing."""
-        self.coordinator.data = {}
-        description = WATER_SENSORS[0]  # Daily usage sensor
-        sensor = SFWaterSensor(self.coordinator, description)
+        daily_sensor.coordinator.data = {}
 
-        assert sensor.native_value == 0  # Default value
+        assert daily_sensor.native_value == 0  # Default value
 
-    def test_sensor_descriptions_count(self):
-        """Test that we have the expected number of sensor descriptions."""
+    def test_sensor_descriptions(self):
+        """Test the sensor description count, keys and translation keys."""
         assert len(WATER_SENSORS) == 1
-
-    def test_sensor_descriptions_keys(self):
-        """Test sensor description keys."""
-        keys = [desc.key for desc in WATER_SENSORS]
-        assert "current_bill_water_usage_to_date" in keys
-
-    def test_sensor_descriptions_translation_keys(self):
-        """Test sensor description translation keys."""
-        translation_keys = [desc.translation_key for desc in WATER_SENSORS]
-        assert "current_bill_water_usage_to_date" in translation_keys
+        assert WATER_SENSORS[0].key == "current_bill_water_usage_to_date"
+        assert WATER_SENSORS[0].translation_key == "current_bill_water_usage_to_date"
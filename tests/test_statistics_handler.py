@@ -2,6 +2,7 @@
 
 from datetime import datetime
 from unittest.mock import AsyncMock, Mock, patch
+import zoneinfo
 
 import pytest
 
@@ -12,8 +13,6 @@ from custom_components.sfpuc.statistics_handler import (
     async_insert_statistics,
 )
 
-from .common import MockConfigEntry
-
 
 class TestStatisticsHandler:
     """Test the SFPUC statistics handling functionality."""
@@ -21,8 +20,6 @@ class TestStatisticsHandler:
     @pytest.fixture(autouse=True)
     def setup_method(self, hass):
         """Set up test fixtures."""
-        self.hass = hass
-        self.config_entry = MockConfigEntry()
         # Add recorder instance to hass.data for statistics insertion
         from homeassistant.components.recorder.util import DATA_INSTANCE
 
@@ -115,6 +112,34 @@ class TestStatisticsHandler:
 
         # Since the function was mocked, it should not have failed with the Mock await error
 
+    @pytest.mark.asyncio
+    async def test_insert_statistics_dispatches_by_resolution(self, hass, config_entry):
+        """Test single- and mixed-resolution lists are inserted in one batch."""
+        coordinator = SFWaterCoordinator(hass, config_entry)
+        hourly = {
+            "timestamp": datetime(2023, 10, 1, 10, 0),
+            "usage": 50.0,
+            "resolution": "hourly",
+        }
+        daily = {
+            "timestamp": datetime(2023, 9, 30),
+            "usage": 150.0,
+            "resolution": "daily",
+        }
+
+        with patch(
+            "custom_components.sfpuc.statistics_handler.async_insert_resolution_statistics",
+            new_callable=AsyncMock,
+        ) as mock_insert:
+            await async_insert_statistics(coordinator, [hourly, hourly])
+            mock_insert.assert_awaited_once_with(
+                coordinator, [hourly, hourly], "hourly"
+            )
+
+            mock_insert.reset_mock()
+            await async_insert_statistics(coordinator, [daily, hourly])
+            mock_insert.assert_awaited_once_with(coordinator, [daily, hourly], "mixed")
+
     @pytest.mark.asyncio
     async def test_insert_statistics_legacy_float(self, hass, config_entry):
         """Test inserting statistics with legacy float format."""
@@ -161,3 +186,82 @@ class TestStatisticsHandler:
             )
 
         mock_add_stats.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_insert_resolution_statistics_mixed_defaults_to_daily(
+        self, hass, config_entry
+    ):
+        """Test points without a resolution in a mixed batch count as daily."""
+        coordinator = SFWaterCoordinator(hass, config_entry)
+
+        data_points = [
+            {"timestamp": datetime(2023, 10, 1, 15, 30), "usage": 10.0},
+            {
+                "timestamp": datetime(2023, 10, 2, 10, 0),
+                "usage": 5.0,
+                "resolution": "hourly",
+            },
+        ]
+
+        mock_recorder = Mock()
+        mock_recorder.async_add_executor_job = AsyncMock(return_value={})
+
+        with (
+            patch(
+                "custom_components.sfpuc.statistics_handler.get_instance",
+                return_value=mock_recorder,
+            ),
+            patch(
+                "custom_components.sfpuc.statistics_handler.async_add_external_statistics"
+            ) as mock_add_stats,
+        ):
+            await async_insert_resolution_statistics(coordinator, data_points, "mixed")
+
+        mock_add_stats.assert_called_once()
+        statistic_data = mock_add_stats.call_args[0][2]
+        starts = [
+            stat["start"].astimezone(zoneinfo.ZoneInfo("America/Los_Angeles"))
+            for stat in statistic_data
+        ]
+        assert [(start.day, start.hour) for start in starts] == [(1, 0), (2, 10)]
+        assert [stat["sum"] for stat in statistic_data] == [10.0, 15.0]
+
+    @pytest.mark.asyncio
+    async def test_insert_resolution_statistics_deduplicates_by_start(
+        self, hass, config_entry
+    ):
+        """Test points normalizing to the same period start are inserted once."""
+        coordinator = SFWaterCoordinator(hass, config_entry)
+
+        data_points = [
+            {"timestamp": datetime(2023, 10, 2), "usage": 20.0, "resolution": "daily"},
+            {
+                "timestamp": datetime(2023, 10, 1, 0, 0),
+                "usage": 10.0,
+                "resolution": "daily",
+            },
+            {
+                "timestamp": datetime(2023, 10, 1, 12, 0),
+                "usage": 15.0,
+                "resolution": "daily",
+            },
+        ]
+
+        mock_recorder = Mock()
+        mock_recorder.async_add_executor_job = AsyncMock(return_value={})
+
+        with (
+            patch(
+                "custom_components.sfpuc.statistics_handler.get_instance",
+                return_value=mock_recorder,
+            ),
+            patch(
+                "custom_components.sfpuc.statistics_handler.async_add_external_statistics"
+            ) as mock_add_stats,
+        ):
+            await async_insert_resolution_statistics(coordinator, data_points, "daily")
+
+        mock_add_stats.assert_called_once()
+        statistic_data = mock_add_stats.call_args[0][2]
+        assert [stat["state"] for stat in statistic_data] == [15.0, 20.0]
+        assert [stat["sum"] for stat in statistic_data] == [15.0, 35.0]